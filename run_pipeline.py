@@ -110,6 +110,11 @@ def main():
         action="store_true",
         help="Enable noise reduction (spectral gating) during audio processing"
     )
+    parser.add_argument(
+        "--vad",
+        action="store_true",
+        help="Find speech with the Silero VAD model instead of silence thresholds (needs silero-vad)"
+    )
     parser.add_argument(
         "--silence-preset",
         choices=["very_sensitive", "sensitive", "balanced", "conservative", "very_conservative"],
@@ -164,7 +169,8 @@ def main():
             refine_sample_rate=args.refine_sample_rate,
             min_face_duration=args.min_face_duration,
             min_chunk_duration=args.min_chunk_duration,
-            apply_noise_reduction=args.reduce_noise
+            apply_noise_reduction=args.reduce_noise,
+            use_vad=args.vad
         )
 
         for _ in tqdm(range(len(timestamps)), desc="Creating chunks", unit="chunk"):
@@ -21,6 +21,7 @@ import logging
 import time
 import tempfile
 import shutil
+from itertools import chain
 
 # Import modular utilities
 from utils.audio_processing import check_dependencies
@@ -28,7 +29,7 @@ from utils.progress_tracking import (
     start_session, end_session, show_progress_history, clear_progress_history
 )
 from utils.file_discovery import (
-    find_processable_videos, validate_video_structure, 
+    iter_processable_videos, validate_video_structure, 
     prepare_video_for_transcription, check_transcription_status
 )
 from utils.transcription_manager import (
@@ -101,6 +102,13 @@ Examples:
         help="Force re-transcription even if already completed"
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Items transcribed in parallel in batch mode, one process each (default: 1)"
+    )
+    
     parser.add_argument(
         "--report-only",
         action="store_true",
@@ -141,6 +149,13 @@ Examples:
         help="Silence padding in ms (default: 100)"
     )
     
+    parser.add_argument(
+        "--seek-step",
+        type=int,
+        default=50,
+        help="Step in ms between silence checks; 1 is exact but slowest (default: 50)"
+    )
+    
     args = parser.parse_args()
     
     # Check dependencies
@@ -183,7 +198,8 @@ Examples:
     silence_params = {
         "min_silence_len": args.min_silence_len,
         "silence_thresh": args.silence_thresh,
-        "keep_silence": args.keep_silence
+        "keep_silence": args.keep_silence,
+        "seek_step": args.seek_step
     }
     
     # Start session tracking
@@ -206,18 +222,22 @@ Examples:
                 sys.exit(1)
                 
             logger.info("🔍 Scanning for processable files...")
-            processable_items = find_processable_videos(args.path)
+            discovered = iter_processable_videos(args.path)
+            first_item = next(discovered, None)
             
-            if not processable_items:
+            if first_item is None:
                 logger.warning(f"⚠️  No processable files found in {args.path}")
                 logger.info("   Looking for: video files (.mp4, .avi, etc.), audio files (.wav, .mp3, etc.), or pre-processed directories")
                 end_session(session_id, {"videos_processed": 0, "videos_successful": 0, "videos_failed": 0, 
                                        "total_chunks": 0, "chunks_transcribed": 0, "duration_seconds": 0})
                 sys.exit(1)
             
-            logger.info(f"📦 Found {len(processable_items)} processable items")
+            processable_items = chain([first_item], discovered)
             
             if args.report_only:
+                processable_items = list(processable_items)
+                logger.info(f"📦 Found {len(processable_items)} processable items")
+                
                 # Generate report for pre-processed items only
                 pre_processed = [item for item in processable_items if not item.get('needs_processing', False)]
                 if pre_processed:
@@ -229,14 +249,16 @@ Examples:
                                        "total_chunks": 0, "chunks_transcribed": 0, "duration_seconds": 0})
                 sys.exit(0)
             
-            # Process all items
+            # Process items while the rest of the directory is still being scanned
+            logger.info("📦 Processing items as they are found...")
             successful, failed, total_chunks, final_transcribed, duration = process_batch_items(
-                processable_items, args.model, args.force, temp_dir, silence_params
+                processable_items, args.model, args.force, temp_dir, silence_params,
+                max_workers=args.workers
             )
             
             # End session tracking
             final_stats = {
-                "videos_processed": len(processable_items),
+                "videos_processed": successful + failed,
                 "videos_successful": successful,
                 "videos_failed": failed,
                 "total_chunks": total_chunks,
@@ -251,8 +273,8 @@ Examples:
             logger.info(f"❌ Failed: {failed}")
             logger.info(f"📊 Success rate: {(successful/(successful+failed)*100):.1f}%" if (successful+failed) > 0 else "N/A")
             logger.info(f"⏱️  Total duration: {duration:.1f} seconds")
-            if len(processable_items) > 0:
-                logger.info(f"⚡ Processing rate: {len(processable_items)/duration:.2f} items/second")
+            if successful + failed > 0:
+                logger.info(f"⚡ Processing rate: {(successful + failed)/duration:.2f} items/second")
             if final_transcribed > 0:
                 logger.info(f"🎵 Chunk transcription rate: {final_transcribed/duration:.1f} chunks/second")
             logger.info("=" * 60)
@@ -316,16 +338,9 @@ Examples:
             
             # Process single item
             start_time = time.time()
-            success = transcribe_video(video_info, args.model, args.force)
+            success, final_transcribed, _ = transcribe_video(video_info, args.model, args.force)
             duration = time.time() - start_time
             
-            # Get final transcription count
-            try:
-                final_status = check_transcription_status(video_info['chunks_dir'], args.model)
-                final_transcribed = final_status['text_count']
-            except:
-                final_transcribed = 0
-            
             # End session tracking
             final_stats = {
                 "videos_processed": 1,
@@ -339,35 +339,17 @@ Examples:
             # Process single item
             start_time = time.time()
             if args.model == "both":
-                success = transcribe_video_both_models(video_info, args.force)
+                success, google_count, whisper_count, _ = transcribe_video_both_models(video_info, args.force)
+                final_transcribed = google_count + whisper_count
             else:
-                success = transcribe_video(video_info, args.model, args.force)
+                success, final_transcribed, _ = transcribe_video(video_info, args.model, args.force)
             duration = time.time() - start_time
             
-            # Get final transcription count
-            try:
-                if args.model == "both":
-                    google_status = check_transcription_status(video_info['chunks_dir'], "google")
-                    whisper_status = check_transcription_status(video_info['chunks_dir'], "whisper")
-                    final_transcribed = google_status['text_count'] + whisper_status['text_count']
-                else:
-                    final_status = check_transcription_status(video_info['chunks_dir'], args.model)
-                    final_transcribed = final_status['text_count']
-            except:
-                final_transcribed = 0
-            
             # Process single item
             start_time = time.time()
-            success = transcribe_video(video_info, args.model, args.force)
+            success, final_transcribed, _ = transcribe_video(video_info, args.model, args.force)
             duration = time.time() - start_time
             
-            # Get final transcription count
-            try:
-                final_status = check_transcription_status(video_info['chunks_dir'], args.model)
-                final_transcribed = final_status['text_count']
-            except:
-                final_transcribed = 0
-            
             # End session tracking
             final_stats = {
                 "videos_processed": 1,
@@ -316,16 +316,9 @@ Examples:
             
             # Process single item
             start_time = time.time()
-            success = transcribe_video(video_info, args.model, args.force)
+            success, final_transcribed, _ = transcribe_video(video_info, args.model, args.force)
             duration = time.time() - start_time
             
-            # Get final transcription count
-            try:
-                final_status = check_transcription_status(video_info['chunks_dir'], args.model)
-                final_transcribed = final_status['text_count']
-            except:
-                final_transcribed = 0
-            
             # End session tracking
             final_stats = {
                 "videos_processed": 1,
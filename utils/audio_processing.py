@@ -33,16 +33,19 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+# Supported media file extensions (lowercase, with leading dot)
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mkv', '.mov', '.webm', '.flv', '.wmv', '.m4v', '.mpg', '.mpeg', '.m2ts'})
+AUDIO_EXTENSIONS = frozenset({'.wav', '.mp3', '.m4a', '.aac', '.flac', '.ogg', '.wma'})
+
+
 def is_video_file(file_path):
     """Check if file is a video file."""
-    video_extensions = {'.mp4', '.avi', '.mkv', '.mov', '.webm', '.flv', '.wmv', '.m4v', '.mpg', '.mpeg', '.m2ts'}
-    return Path(file_path).suffix.lower() in video_extensions
+    return os.path.splitext(file_path)[1].lower() in VIDEO_EXTENSIONS
 
 
 def is_audio_file(file_path):
     """Check if file is an audio file."""
-    audio_extensions = {'.wav', '.mp3', '.m4a', '.aac', '.flac', '.ogg', '.wma'}
-    return Path(file_path).suffix.lower() in audio_extensions
+    return os.path.splitext(file_path)[1].lower() in AUDIO_EXTENSIONS
 
 
 def extract_audio_from_video(video_path, output_path):
@@ -64,7 +67,8 @@ def extract_audio_from_video(video_path, output_path):
         return False
 
 
-def split_audio_into_chunks(audio_path, output_dir, min_silence_len=500, silence_thresh=-40, keep_silence=100):
+def split_audio_into_chunks(audio_path, output_dir, min_silence_len=500, silence_thresh=-40, keep_silence=100,
+                            seek_step=50):
     """Split audio file into chunks based on silence."""
     if not PYDUB_AVAILABLE:
         raise ImportError("Pydub is required for audio processing. Install with: pip install pydub")
@@ -80,7 +84,8 @@ def split_audio_into_chunks(audio_path, output_dir, min_silence_len=500, silence
             audio,
             min_silence_len=min_silence_len,
             silence_thresh=silence_thresh,
-            keep_silence=keep_silence
+            keep_silence=keep_silence,
+            seek_step=seek_step  # ms between silence checks; 1 is exact but 50x slower than 50
         )
         
         if not chunks:
@@ -112,10 +117,13 @@ def split_audio_into_chunks(audio_path, output_dir, min_silence_len=500, silence
 def create_chunks_structure(file_path, temp_dir, silence_params=None):
     """Create chunks structure from video or audio file."""
     if silence_params is None:
-        silence_params = {"min_silence_len": 500, "silence_thresh": -40, "keep_silence": 100}
+        silence_params = {"min_silence_len": 500, "silence_thresh": -40, "keep_silence": 100, "seek_step": 50}
     
     file_name = Path(file_path).stem
-    chunks_dir = os.path.join(temp_dir, file_name, "chunks")
+    # Unique per item: X.mp4 and X.wav share a video_id, and batch items are
+    # prepared while others are transcribed (or run in parallel)
+    work_dir = tempfile.mkdtemp(prefix=f"{file_name}_", dir=temp_dir)
+    chunks_dir = os.path.join(work_dir, "chunks")
     audio_chunks_dir = os.path.join(chunks_dir, "audio")
     
     # Create directory structure
@@ -123,7 +131,7 @@ def create_chunks_structure(file_path, temp_dir, silence_params=None):
     
     if is_video_file(file_path):
         # Extract audio from video
-        temp_audio_path = os.path.join(temp_dir, f"{file_name}.wav")
+        temp_audio_path = os.path.join(work_dir, f"{file_name}.wav")
         if not extract_audio_from_video(file_path, temp_audio_path):
             return None
         source_audio = temp_audio_path
@@ -141,7 +149,7 @@ def create_chunks_structure(file_path, temp_dir, silence_params=None):
     
     return {
         'video_id': file_name,
-        'video_dir': os.path.join(temp_dir, file_name),
+        'video_dir': work_dir,
         'chunks_dir': chunks_dir,
         'audio_count': len(chunk_files),
         'is_temporary': True
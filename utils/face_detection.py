@@ -1,41 +1,233 @@
 import cv2
 import numpy as np
-from moviepy.editor import VideoFileClip
 import os
+from functools import lru_cache
 
+HAAR_CASCADE_PATH = cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
 
-def detect_faces_in_frame(frame, face_cascade=None, min_face_size=(30, 30)):
+# cv2.cuda only reads old-format cascades (OpenCV's data/haarcascades_cuda), which pip
+# wheels do not ship; point HAAR_CASCADE_CUDA_PATH at one to enable the GPU cascade
+HAAR_CASCADE_CUDA_PATH = os.getenv('HAAR_CASCADE_CUDA_PATH', os.path.join(
+    os.path.dirname(os.path.normpath(cv2.data.haarcascades)), 'haarcascades_cuda',
+    'haarcascade_frontalface_default.xml'))
+
+# Haar cost scales with pixel count, so frames are shrunk to this longest side before detection
+DETECTION_MAX_DIM = 480
+
+# YuNet (OpenCV DNN) model; the ONNX file is not bundled, point YUNET_MODEL_PATH at it
+YUNET_MODEL_PATH = os.getenv('YUNET_MODEL_PATH', os.path.join('models', 'face_detection_yunet_2023mar.onnx'))
+YUNET_AVAILABLE = hasattr(cv2, 'FaceDetectorYN') and os.path.isfile(YUNET_MODEL_PATH)
+
+# GPU cascade needs an OpenCV build with CUDA and at least one visible device
+try:
+    CUDA_FACE_DETECTION_AVAILABLE = cv2.cuda.getCudaEnabledDeviceCount() > 0
+except (AttributeError, cv2.error):
+    CUDA_FACE_DETECTION_AVAILABLE = False
+
+
+class CudaFaceCascade:
+    """Haar cascade evaluated on the GPU with cv2.cuda, reusing one upload buffer."""
+    
+    def __init__(self, cascade_path=HAAR_CASCADE_CUDA_PATH, min_face_size=(30, 30)):
+        self._cascade = cv2.cuda.CascadeClassifier_create(cascade_path)
+        self._cascade.setScaleFactor(1.1)
+        self._cascade.setMinNeighbors(5)
+        self._cascade.setMinObjectSize(min_face_size)
+        self._gpu_frame = cv2.cuda_GpuMat()
+    
+    def detect(self, gray, min_face_size=None):
+        """Detect faces in a grayscale frame, returning [(x, y, w, h), ...]."""
+        if min_face_size is not None:
+            self._cascade.setMinObjectSize(min_face_size)
+        self._gpu_frame.upload(gray)
+        objects = self._cascade.detectMultiScale(self._gpu_frame)
+        faces = self._cascade.convert(objects)
+        return faces if faces is not None else ()
+
+
+class YuNetFaceDetector:
+    """YuNet DNN face detector run on color frames at their own size (see prepare_frame_for_detection)."""
+    
+    def __init__(self, model_path=YUNET_MODEL_PATH, input_size=(320, 240), score_threshold=0.6):
+        self._input_size = input_size
+        self._detector = cv2.FaceDetectorYN.create(model_path, "", input_size, score_threshold)
+    
+    def detect(self, frame):
+        """Detect faces in an RGB (or grayscale) frame, returning [(x, y, w, h), ...] in frame coordinates."""
+        height, width = frame.shape[:2]
+        if (width, height) != self._input_size:
+            # Match the network input to the frame so its aspect ratio is kept
+            self._input_size = (width, height)
+            self._detector.setInputSize(self._input_size)
+        conversion = cv2.COLOR_GRAY2BGR if frame.ndim == 2 else cv2.COLOR_RGB2BGR
+        _, faces = self._detector.detect(cv2.cvtColor(frame, conversion))
+        if faces is None:
+            return ()
+        return np.round(faces[:, :4]).astype(np.int32)
+
+
+def create_face_cascade():
+    """Load the frontal face cascade, on the GPU when CUDA is available."""
+    if CUDA_FACE_DETECTION_AVAILABLE and os.path.isfile(HAAR_CASCADE_CUDA_PATH):
+        try:
+            return CudaFaceCascade()
+        except (AttributeError, cv2.error):
+            pass  # No cudaobjdetect module, or the cascade is not usable on the GPU; use the CPU cascade
+    return cv2.CascadeClassifier(HAAR_CASCADE_PATH)
+
+
+def create_face_detector():
+    """Load the best available face detector: YuNet if its model is present, else the Haar cascade."""
+    if YUNET_AVAILABLE:
+        return YuNetFaceDetector()
+    return create_face_cascade()
+
+
+@lru_cache(maxsize=1)
+def get_face_detector():
+    """Return the process-wide face detector, loading it on first use."""
+    return create_face_detector()
+
+
+def prepare_frame_for_detection(frame, max_dim=DETECTION_MAX_DIM, grayscale=True):
     """
-    Detect faces in a single frame using OpenCV's Haar cascade classifier.
+    Convert a frame to grayscale and shrink it so its longest side is at most max_dim.
     
     Args:
-        frame: Input frame (numpy array)
-        face_cascade: Pre-loaded face cascade classifier
-        min_face_size: Minimum face size to detect (width, height)
+        frame: RGB frame, or an already grayscale frame (2D array)
+        max_dim: Maximum size of the longest side in pixels
+        grayscale: Convert to grayscale (Haar); False keeps the colors (YuNet)
     
     Returns:
-        List of face bounding boxes [(x, y, w, h), ...]
+        (frame, scale) where scale is the applied resize factor (<= 1.0)
+    """
+    if grayscale and frame.ndim == 3:
+        frame = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+    scale = max_dim / max(frame.shape[:2])
+    if scale >= 1.0:
+        return frame, 1.0
+    return cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA), scale
+
+
+def detect_faces_in_frame(frame, face_cascade=None, min_face_size=(30, 30), frame_scale=1.0):
+    """
+    Detect faces in a single frame using OpenCV's Haar cascade classifier (or YuNet).
+    
+    Args:
+        frame: Input frame (RGB, or grayscale 2D array; YuNet needs RGB)
+        face_cascade: Pre-loaded face detector (CPU cascade, CudaFaceCascade or YuNetFaceDetector)
+        min_face_size: Minimum face size to detect (width, height), in original frame pixels
+        frame_scale: Resize factor already applied to frame (see prepare_frame_for_detection)
+    
+    Returns:
+        List of face bounding boxes [(x, y, w, h), ...] in original frame coordinates
     """
     if face_cascade is None:
-        face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+        face_cascade = get_face_detector()
     
-    # Convert to grayscale for face detection
-    gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+    # Grayscale (Haar only) and downscale before detection; boxes are mapped back below
+    is_yunet = isinstance(face_cascade, YuNetFaceDetector)
+    gray, scale = prepare_frame_for_detection(frame, grayscale=not is_yunet)
+    scale *= frame_scale
+    min_size = tuple(max(1, round(size * scale)) for size in min_face_size)
     
-    # Detect faces
-    faces = face_cascade.detectMultiScale(
-        gray,
-        scaleFactor=1.1,
-        minNeighbors=5,
-        minSize=min_face_size,
-        flags=cv2.CASCADE_SCALE_IMAGE
-    )
+    if is_yunet:
+        # Apply the same minimum face size the cascades are given
+        faces = face_cascade.detect(gray)
+        if len(faces):
+            faces = faces[(faces[:, 2] >= min_size[0]) & (faces[:, 3] >= min_size[1])]
+    elif isinstance(face_cascade, CudaFaceCascade):
+        faces = face_cascade.detect(gray, min_size)
+    else:
+        faces = face_cascade.detectMultiScale(
+            gray,
+            scaleFactor=1.1,
+            minNeighbors=5,
+            minSize=min_size,
+            flags=cv2.CASCADE_SCALE_IMAGE
+        )
+    
+    if scale != 1.0 and len(faces):
+        faces = np.round(np.asarray(faces) / scale).astype(np.int32)
     
     return faces
 
 
+def open_video_capture(video_path, use_gpu_decode=True):
+    """
+    Open video_path with OpenCV, asking the FFmpeg backend for hardware decoding.
+    
+    With use_gpu_decode, the capture requests any available hardware decoder
+    (NVDEC, VA-API, ...); OpenCV decodes in software when none is usable.
+    Frames are returned in system memory either way.
+    
+    Args:
+        video_path: Path to the video file
+        use_gpu_decode: Whether to request hardware accelerated decoding
+    
+    Returns:
+        cv2.VideoCapture for video_path
+    """
+    if use_gpu_decode and hasattr(cv2, 'VIDEO_ACCELERATION_ANY'):
+        try:
+            capture = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG,
+                                       [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
+            if capture.isOpened():
+                return capture
+            capture.release()
+        except cv2.error:
+            pass
+    return cv2.VideoCapture(video_path)
+
+
+def iter_sampled_frames(capture, sample_times):
+    """
+    Yield (timestamp, frame) for each sample time by decoding the video sequentially.
+    
+    Seeks once to the first sample and then walks forward through the stream,
+    only converting the frames that land on the sample grid. This replaces one
+    random seek (and ffmpeg pipe restart) per sample with a single linear decode.
+    
+    Args:
+        capture: Opened cv2.VideoCapture
+        sample_times: Increasing sample timestamps in seconds
+    
+    Yields:
+        (timestamp, frame) tuples with RGB frames; stops at the end of the video
+    """
+    fps = capture.get(cv2.CAP_PROP_FPS)
+    if not fps or len(sample_times) == 0:
+        return
+    
+    # Same frame selection as MoviePy's get_frame(t)
+    target_indices = [int(fps * t + 0.00001) for t in sample_times]
+    
+    # Seek only when the first target is behind the decoder or far ahead of it;
+    # otherwise decoding forward is cheaper than a keyframe seek
+    position = int(capture.get(cv2.CAP_PROP_POS_FRAMES))
+    if target_indices[0] < position or target_indices[0] - position > fps:
+        capture.set(cv2.CAP_PROP_POS_FRAMES, target_indices[0])
+        position = int(capture.get(cv2.CAP_PROP_POS_FRAMES))
+    
+    last_index = None
+    frame = None
+    for t, target in zip(sample_times, target_indices):
+        if target != last_index:
+            # Skip (grab without converting) up to the target frame
+            while position <= target:
+                if not capture.grab():
+                    return
+                position += 1
+            ok, bgr = capture.retrieve()
+            if not ok:
+                return
+            frame = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+            last_index = target
+        yield t, frame
+
+
 def has_face_in_timerange(video_path, start_time, end_time, sample_interval=0.5, 
-                         face_threshold=0.3, min_face_size=(30, 30)):
+                         face_threshold=0.3, min_face_size=(30, 30), capture=None):
     """
     Check if there are faces in a given time range of a video.
     
@@ -46,13 +238,22 @@ def has_face_in_timerange(video_path, start_time, end_time, sample_interval=0.5,
         sample_interval: How often to sample frames (seconds)
         face_threshold: Minimum ratio of frames with faces to consider chunk valid
         min_face_size: Minimum face size to detect
+        capture: Optional already-opened cv2.VideoCapture for video_path, shared
+            across calls so consecutive time ranges are decoded in one forward pass
     
     Returns:
         bool: True if faces are detected in sufficient frames
     """
     try:
-        video = VideoFileClip(video_path)
-        face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+        if capture is None:
+            own_capture = open_video_capture(video_path)
+            try:
+                return has_face_in_timerange(video_path, start_time, end_time, sample_interval,
+                                             face_threshold, min_face_size, capture=own_capture)
+            finally:
+                own_capture.release()
+        
+        face_cascade = get_face_detector()
         
         # Sample frames at regular intervals
         sample_times = np.arange(start_time, end_time, sample_interval)
@@ -62,20 +263,14 @@ def has_face_in_timerange(video_path, start_time, end_time, sample_interval=0.5,
         if total_frames == 0:
             return False
         
-        for t in sample_times:
-            if t >= video.duration:
-                break
-                
-            # Get frame at time t
-            frame = video.get_frame(t)
-            
+        # Frames are decoded sequentially; sampling stops at the end of the video
+        for t, frame in iter_sampled_frames(capture, sample_times):
             # Detect faces
             faces = detect_faces_in_frame(frame, face_cascade, min_face_size)
             
             if len(faces) > 0:
                 frames_with_faces += 1
         
-        video.close()
         
         # Check if face detection ratio meets threshold
         face_ratio = frames_with_faces / total_frames if total_frames > 0 else 0
@@ -87,7 +282,8 @@ def has_face_in_timerange(video_path, start_time, end_time, sample_interval=0.5,
 
 
 def filter_chunks_with_faces(video_path, timestamps, sample_interval=0.5, 
-                           face_threshold=0.3, min_face_size=(30, 30), show_progress=True):
+                           face_threshold=0.3, min_face_size=(30, 30), show_progress=True,
+                           use_gpu_decode=True):
     """
     Filter chunks to only keep those with detected faces.
     
@@ -98,6 +294,7 @@ def filter_chunks_with_faces(video_path, timestamps, sample_interval=0.5,
         face_threshold: Minimum ratio of frames with faces to consider chunk valid
         min_face_size: Minimum face size to detect
         show_progress: Whether to show progress
+        use_gpu_decode: Decode the video on the GPU when a hardware decoder is available
     
     Returns:
         List of filtered timestamps with faces
@@ -110,19 +307,25 @@ def filter_chunks_with_faces(video_path, timestamps, sample_interval=0.5,
     print(f"  - Face threshold: {face_threshold*100}%")
     print(f"  - Min face size: {min_face_size}")
     
-    for i, (start, end) in enumerate(timestamps):
-        if show_progress and i % 10 == 0:
-            print(f"Processing chunk {i+1}/{len(timestamps)}...")
-        
-        duration = end - start
-        print(f"Checking chunk {i}: {start:.2f}s-{end:.2f}s (duration: {duration:.2f}s)")
-        
-        if has_face_in_timerange(video_path, start, end, sample_interval, 
-                               face_threshold, min_face_size):
-            filtered_timestamps.append((start, end))
-            print(f"  ✅ Face detected - keeping chunk")
-        else:
-            print(f"  ❌ No face detected - removing chunk")
+    # One capture for all chunks: they are in time order, so the decoder mostly
+    # walks forward instead of reopening and seeking the video per chunk
+    capture = open_video_capture(video_path, use_gpu_decode)
+    try:
+        for i, (start, end) in enumerate(timestamps):
+            if show_progress and i % 10 == 0:
+                print(f"Processing chunk {i+1}/{len(timestamps)}...")
+            
+            duration = end - start
+            print(f"Checking chunk {i}: {start:.2f}s-{end:.2f}s (duration: {duration:.2f}s)")
+            
+            if has_face_in_timerange(video_path, start, end, sample_interval, 
+                                   face_threshold, min_face_size, capture=capture):
+                filtered_timestamps.append((start, end))
+                print(f"  ✅ Face detected - keeping chunk")
+            else:
+                print(f"  ❌ No face detected - removing chunk")
+    finally:
+        capture.release()
     
     print(f"\nFace filtering results:")
     print(f"  Original chunks: {len(timestamps)}")
@@ -145,13 +348,17 @@ def save_face_detection_preview(video_path, timestamps, output_dir, max_previews
     preview_dir = os.path.join(output_dir, "face_detection_previews")
     os.makedirs(preview_dir, exist_ok=True)
     
-    video = VideoFileClip(video_path)
-    face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+    face_cascade = get_face_detector()
     
-    for i, (start, end) in enumerate(timestamps[:max_previews]):
-        mid_time = (start + end) / 2
-        frame = video.get_frame(mid_time)
-        
+    # Chunk midpoints are increasing, so one sequential pass reads every preview frame
+    mid_times = [(start + end) / 2 for start, end in timestamps[:max_previews]]
+    capture = open_video_capture(video_path)
+    try:
+        previews = list(iter_sampled_frames(capture, mid_times))
+    finally:
+        capture.release()
+    
+    for i, (mid_time, frame) in enumerate(previews):
         # Make frame writable by copying it
         frame = frame.copy()
         
@@ -166,5 +373,4 @@ def save_face_detection_preview(video_path, timestamps, output_dir, max_previews
         preview_path = os.path.join(preview_dir, f"chunk_{i:03d}_faces.jpg")
         cv2.imwrite(preview_path, cv2.cvtColor(frame, cv2.COLOR_RGB2BGR))
     
-    video.close()
     print(f"Saved {min(len(timestamps), max_previews)} face detection previews in {preview_dir}")
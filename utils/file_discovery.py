@@ -10,88 +10,186 @@ This module provides utilities for discovering and organizing media files:
 """
 
 import os
+import time
+import hashlib
+import shutil
 import logging
-from pathlib import Path
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+
+from .audio_processing import VIDEO_EXTENSIONS, AUDIO_EXTENSIONS
+
+# Prefer orjson for metadata serialization when available; fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Number of threads used to prefetch chunk transcript reads
+CHUNK_READ_WORKERS = 8
 
-def find_processable_videos(root_dir):
+# Directories modified within this window are listed again instead of trusting a
+# cached count: their mtime may not have ticked yet for an entry added just now
+COUNT_CACHE_SETTLE_NS = 2_000_000_000
+
+# Chunk counts persisted under logs/ (one small file per chunks_dir, named by a hash
+# of its absolute path), so a re-run skips listing directories that haven't changed
+# since the last run without writing anything into the dataset itself
+COUNT_CACHE_DIR = os.path.abspath(os.path.join("logs", "chunk_counts"))
+
+# Serializes the read-modify-write of the count cache files between threads, so
+# concurrent status checks don't drop each other's entries
+_count_cache_lock = threading.Lock()
+
+# Process umask, applied to files written through a (0600) temporary file
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def iter_processable_videos(root_dir):
     """
-    Find all processable items in a directory.
+    Yield the processable items in a directory as they are found.
     
-    Returns a list of items that can be processed, including:
-    - Pre-processed video directories (with chunks/audio/*.wav)
-    - Raw video files
-    - Raw audio files
+    Yields the same item dictionaries as find_processable_videos, one directory
+    entry at a time, so a consumer can start on the first item while the rest
+    of the directory is still being scanned.
     """
-    from .audio_processing import is_video_file, is_audio_file
-    
-    processable = []
-    
-    if not os.path.isdir(root_dir):
+    try:
+        root_entries = os.scandir(root_dir)
+    except (FileNotFoundError, NotADirectoryError):
         logger.error(f"❌ Not a directory: {root_dir}")
-        return processable
+        return
     
-    for item in os.listdir(root_dir):
-        item_path = os.path.join(root_dir, item)
-        
-        if os.path.isdir(item_path):
-            # Check if it's a pre-processed directory
-            chunks_dir = os.path.join(item_path, "chunks")
-            audio_dir = os.path.join(chunks_dir, "audio")
+    # DirEntry caches the file type from the directory read, so no extra stat per item
+    with root_entries:
+        for entry in root_entries:
+            item = entry.name
+            item_path = entry.path
             
-            if os.path.exists(audio_dir):
-                wav_files = [f for f in os.listdir(audio_dir) if f.endswith(".wav")]
+            if entry.is_dir():
+                # Check if it's a pre-processed directory
+                chunks_dir = os.path.join(item_path, "chunks")
+                audio_dir = os.path.join(chunks_dir, "audio")
+                
+                wav_files = _list_files(audio_dir, ".wav")
+                
                 if wav_files:
-                    processable.append({
+                    yield {
                         'video_id': item,
                         'video_dir': item_path,
                         'chunks_dir': chunks_dir,
                         'audio_count': len(wav_files),
                         'needs_processing': False,
                         'file_type': 'pre_processed'
-                    })
-                    
-        elif os.path.isfile(item_path):
-            # Check if it's a raw video or audio file
-            if is_video_file(item_path):
-                file_name = Path(item_path).stem
-                processable.append({
-                    'video_id': file_name,
-                    'file_path': item_path,
-                    'file_type': 'video',
-                    'needs_processing': True
-                })
-            elif is_audio_file(item_path):
-                file_name = Path(item_path).stem
-                processable.append({
-                    'video_id': file_name,
-                    'file_path': item_path,
-                    'file_type': 'audio',
-                    'needs_processing': True
-                })
-                
-    return processable
+                    }
+                        
+            elif entry.is_file():
+                # Check if it's a raw video or audio file
+                file_name, ext = os.path.splitext(item)
+                ext = ext.lower()
+                if ext in VIDEO_EXTENSIONS:
+                    yield {
+                        'video_id': file_name,
+                        'file_path': item_path,
+                        'file_type': 'video',
+                        'needs_processing': True
+                    }
+                elif ext in AUDIO_EXTENSIONS:
+                    yield {
+                        'video_id': file_name,
+                        'file_path': item_path,
+                        'file_type': 'audio',
+                        'needs_processing': True
+                    }
 
 
-def check_transcription_status(chunks_dir, model):
-    """Check if transcription already exists and get status."""
-    text_dir = os.path.join(chunks_dir, "text" if model == "whisper" else "text_google")
-    audio_dir = os.path.join(chunks_dir, "audio")
-    
-    if not os.path.exists(text_dir):
-        return {"exists": False, "complete": False, "audio_count": 0, "text_count": 0}
+def find_processable_videos(root_dir):
+    """
+    Find all processable items in a directory.
     
-    if not os.path.exists(audio_dir):
-        return {"exists": False, "complete": False, "audio_count": 0, "text_count": 0}
+    Returns a list of items that can be processed, including:
+    - Pre-processed video directories (with chunks/audio/*.wav)
+    - Raw video files
+    - Raw audio files
+    """
+    return list(iter_processable_videos(root_dir))
+
+
+def _list_files(directory, suffix):
+    """
+    List the entries in directory whose name ends with suffix.
     
-    audio_files = [f for f in os.listdir(audio_dir) if f.endswith(".wav")]
-    text_files = [f for f in os.listdir(text_dir) if f.endswith(".txt")]
+    Returns None if the directory doesn't exist, so callers can skip a separate
+    existence check before listing.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return [entry for entry in it if entry.name.endswith(suffix)]
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _load_count_cache(cache_path):
+    try:
+        with open(cache_path, 'rb') as f:
+            data = f.read()
+        return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+    except (OSError, ValueError):
+        return {}
+
+
+@lru_cache(maxsize=4096)
+def _count_files_at(directory, suffix, mtime_ns):
+    parent = os.path.abspath(os.path.dirname(directory))
+    cache_path = os.path.join(COUNT_CACHE_DIR, hashlib.sha1(os.fsencode(parent)).hexdigest() + ".json")
+    key = f"{os.path.basename(directory)}/{suffix}"
+    counts = _load_count_cache(cache_path)
+    if counts.get(key, (None,))[0] == mtime_ns:
+        return counts[key][1]
+    
+    files = _list_files(directory, suffix)
+    if files is None:
+        return None
+    with _count_cache_lock:
+        counts = _load_count_cache(cache_path)
+        counts[key] = [mtime_ns, len(files)]
+        try:
+            os.makedirs(COUNT_CACHE_DIR, exist_ok=True)
+            write_metadata_json(counts, cache_path)
+        except OSError:
+            pass  # Read-only working directory; the count is still valid
+    return len(files)
+
+
+def _count_files(directory, suffix):
+    """
+    Count the entries in directory whose name ends with suffix (None if it doesn't exist).
     
-    audio_count = len(audio_files)
-    text_count = len(text_files)
+    Counts are cached on the directory's mtime, which changes whenever an entry
+    is added, removed or renamed, so re-checking an unchanged directory costs a
+    stat instead of a full listing. The cache lives in memory and in a file
+    under COUNT_CACHE_DIR, so it also carries over between runs.
+    """
+    try:
+        mtime_ns = os.stat(directory).st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    if time.time_ns() - mtime_ns < COUNT_CACHE_SETTLE_NS:
+        files = _list_files(directory, suffix)
+        return None if files is None else len(files)
+    return _count_files_at(directory, suffix, mtime_ns)
+
+
+def _transcription_status(text_count, audio_count):
+    if text_count is None or audio_count is None:
+        return {"exists": False, "complete": False, "audio_count": 0, "text_count": 0}
     
     return {
         "exists": True,
@@ -101,6 +199,37 @@ def check_transcription_status(chunks_dir, model):
     }
 
 
+def check_transcription_status(chunks_dir, model):
+    """Check if transcription already exists and get status."""
+    text_dir = os.path.join(chunks_dir, "text" if model == "whisper" else "text_google")
+    audio_dir = os.path.join(chunks_dir, "audio")
+    
+    text_count = _count_files(text_dir, ".txt")
+    if text_count is None:
+        return _transcription_status(None, None)
+    
+    return _transcription_status(text_count, _count_files(audio_dir, ".wav"))
+
+
+def check_transcription_status_multi(chunks_dir, models):
+    """
+    Check the transcription status of several models at once.
+    
+    The shared audio directory is counted once instead of once per model.
+    
+    Returns:
+        Dictionary mapping each model to its check_transcription_status() result
+    """
+    audio_count = _count_files(os.path.join(chunks_dir, "audio"), ".wav")
+    return {
+        model: _transcription_status(
+            _count_files(os.path.join(chunks_dir, "text" if model == "whisper" else "text_google"), ".txt"),
+            audio_count
+        )
+        for model in models
+    }
+
+
 def prepare_video_for_transcription(item_info, temp_dir, silence_params):
     """
     Prepare a video item for transcription.
@@ -137,6 +266,56 @@ def prepare_video_for_transcription(item_info, temp_dir, silence_params):
     return video_info
 
 
+def write_metadata_json(metadata, metadata_path):
+    """
+    Write a metadata dictionary to a JSON file (orjson when available).
+    
+    The payload is serialized up front, written to a uniquely named temporary
+    sibling file in a single write and then atomically renamed over
+    metadata_path, so readers never see a partially written file and
+    concurrent writers don't clobber each other's temporary file.
+    """
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(metadata, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    with tempfile.NamedTemporaryFile(dir=os.path.dirname(metadata_path) or '.',
+                                     prefix=os.path.basename(metadata_path) + '.',
+                                     suffix='.tmp', delete=False) as f:
+        f.write(data)
+    try:
+        # The temporary file is created 0600; give the result the usual umask-based mode
+        os.chmod(f.name, 0o666 & ~_UMASK)
+        os.replace(f.name, metadata_path)
+    except OSError:
+        os.remove(f.name)
+        raise
+
+
+def copy_chunk_files(entries, dst_dir):
+    """
+    Copy chunk files (os.DirEntry objects from a scandir listing) into dst_dir.
+    
+    Files whose destination already has the same size and mtime (as left by a
+    previous shutil.copy2) are skipped, so re-runs only scan metadata.
+    
+    Returns:
+        int: Number of chunk files in entries
+    """
+    for entry in entries:
+        dst_path = os.path.join(dst_dir, entry.name)
+        src_stat = entry.stat()
+        try:
+            dst_stat = os.stat(dst_path)
+            if dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime_ns == src_stat.st_mtime_ns:
+                continue
+        except FileNotFoundError:
+            pass
+        shutil.copy2(entry.path, dst_path)
+    return len(entries)
+
+
 def copy_transcripts_to_outputs(video_info, model):
     """
     Copy transcription results to organized outputs directory.
@@ -154,7 +333,8 @@ def copy_transcripts_to_outputs(video_info, model):
     # Source text directory
     text_dir = os.path.join(chunks_dir, "text" if model == "whisper" else "text_google")
     
-    if not os.path.exists(text_dir):
+    text_files = _list_files(text_dir, ".txt")
+    if text_files is None:
         logger.warning(f"⚠️  No transcription results found for {video_id}")
         return
     
@@ -169,45 +349,33 @@ def copy_transcripts_to_outputs(video_info, model):
             os.makedirs(output_text_dir, exist_ok=True)
 
             # Copy transcription files
-            import shutil
-            text_files = [f for f in os.listdir(text_dir) if f.endswith(".txt")]
-
-            for text_file in text_files:
-                src_path = os.path.join(text_dir, text_file)
-                dst_path = os.path.join(output_text_dir, text_file)
-                shutil.copy2(src_path, dst_path)
+            text_count = copy_chunk_files(text_files, output_text_dir)
 
-            logger.info(f"📋 Copied {len(text_files)} transcripts to: {output_text_dir}")
+            logger.info(f"📋 Copied {text_count} transcripts to: {output_text_dir}")
 
             # Also copy audio chunks for reference
             audio_dir = os.path.join(chunks_dir, "audio")
             output_audio_dir = os.path.join(output_chunks_dir, "audio")
 
-            if os.path.exists(audio_dir):
+            wav_files = _list_files(audio_dir, ".wav")
+            if wav_files is not None:
                 os.makedirs(output_audio_dir, exist_ok=True)
-                wav_files = [f for f in os.listdir(audio_dir) if f.endswith(".wav")]
+                wav_count = copy_chunk_files(wav_files, output_audio_dir)
 
-                for wav_file in wav_files:
-                    src_path = os.path.join(audio_dir, wav_file)
-                    dst_path = os.path.join(output_audio_dir, wav_file)
-                    shutil.copy2(src_path, dst_path)
-
-                logger.info(f"🎵 Copied {len(wav_files)} audio chunks to: {output_audio_dir}")
+                logger.info(f"🎵 Copied {wav_count} audio chunks to: {output_audio_dir}")
 
             # Create metadata file
             metadata = {
                 "video_id": video_id,
                 "model": model,
                 "audio_chunks": video_info.get('audio_count', 0),
-                "transcription_files": len(text_files),
+                "transcription_files": text_count,
                 "processed_timestamp": str(datetime.now()),
                 "source_file": video_info.get('source_file', 'unknown')
             }
 
             metadata_path = os.path.join(outputs_dir, "metadata.json")
-            import json
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            write_metadata_json(metadata, metadata_path)
 
             logger.info(f"📄 Created metadata file: {metadata_path}")
 
@@ -229,31 +397,24 @@ def copy_transcripts_to_outputs(video_info, model):
             combined = combine_chunks_to_single_file(text_dir, transcript_path)
 
             # Copy individual chunk files for reference
-            import shutil
             chunks_out_dir = os.path.join(target_folder, "chunks")
             os.makedirs(chunks_out_dir, exist_ok=True)
-            text_files = [f for f in os.listdir(text_dir) if f.endswith(".txt")]
-            for text_file in text_files:
-                src_path = os.path.join(text_dir, text_file)
-                dst_path = os.path.join(chunks_out_dir, text_file)
-                shutil.copy2(src_path, dst_path)
+            text_count = copy_chunk_files(text_files, chunks_out_dir)
 
             logger.info(f"📄 Saved combined transcript to: {transcript_path} (combined {combined} chunks)")
-            logger.info(f"📋 Copied {len(text_files)} individual chunk transcripts to: {chunks_out_dir}")
+            logger.info(f"📋 Copied {text_count} individual chunk transcripts to: {chunks_out_dir}")
 
             # Create a lightweight metadata file next to transcripts
             metadata = {
                 "video_id": video_id,
                 "model": model,
                 "audio_chunks": video_info.get('audio_count', 0),
-                "transcription_files": len(text_files),
+                "transcription_files": text_count,
                 "processed_timestamp": str(datetime.now()),
                 "source_dir": video_dir or chunks_dir
             }
             metadata_path = os.path.join(target_folder, "metadata.json")
-            import json
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            write_metadata_json(metadata, metadata_path)
 
             logger.info(f"📄 Created metadata file: {metadata_path}")
     
@@ -337,38 +498,53 @@ def save_both_models_transcripts(video_info, original_file_path=None):
         logger.warning(f"⚠️  No transcriptions were saved for {video_id}")
 
 
-def combine_chunks_to_single_file(text_dir, output_file_path):
+def _read_stripped(text_path):
+    """Read a chunk transcript and strip it; returns None if the file can't be read."""
+    try:
+        with open(text_path, 'r', encoding='utf-8') as tf:
+            return tf.read().strip()
+    except Exception as e:
+        logger.warning(f"⚠️  Error reading {os.path.basename(text_path)}: {e}")
+        return None
+
+
+def combine_chunks_to_single_file(text_dir, output_file_path, entries=None, return_contents=False):
     """
     Combine all chunk transcript files into a single file.
     
     Args:
         text_dir: Directory containing chunk text files
         output_file_path: Path where the combined file should be saved
+        entries: Optional pre-scanned .txt entries of text_dir (sorted by name)
+        return_contents: Also return the (filename, content) pairs that were read
     
     Returns:
-        int: Number of chunks combined
+        int: Number of chunks combined, or (valid_chunks, chunk_contents) when
+        return_contents is True; content is None for chunks that couldn't be read
     """
-    text_files = [f for f in os.listdir(text_dir) if f.endswith(".txt")]
-    text_files.sort()  # Ensure proper order
+    if entries is None:
+        with os.scandir(text_dir) as it:
+            entries = sorted((e for e in it if e.name.endswith(".txt")), key=lambda e: e.name)  # Ensure proper order
     
-    combined_content = []
     valid_chunks = 0
-    
-    for text_file in text_files:
-        text_path = os.path.join(text_dir, text_file)
-        try:
-            with open(text_path, 'r', encoding='utf-8') as tf:
-                content = tf.read().strip()
-                if content and content not in ['[Unrecognized Speech]', '']:
-                    combined_content.append(content)
-                    valid_chunks += 1
-        except Exception as e:
-            logger.warning(f"⚠️  Error reading {text_file}: {e}")
-    
-    # Write combined content to output file
-    with open(output_file_path, 'w', encoding='utf-8') as f:
-        f.write(' '.join(combined_content))
-    
+    chunk_contents = []
+    
+    # Prefetch chunk reads on a thread pool (small reads are latency bound) and
+    # stream each chunk straight to the output file in order
+    with ThreadPoolExecutor(max_workers=CHUNK_READ_WORKERS) as ex, \
+            open(output_file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        contents = ex.map(_read_stripped, [entry.path for entry in entries])
+        for entry, content in zip(entries, contents):
+            if return_contents:
+                chunk_contents.append((entry.name, content))
+            if content and content not in ['[Unrecognized Speech]', '']:
+                if valid_chunks:
+                    f.write(' ')
+                f.write(content)
+                valid_chunks += 1
+    
+    if return_contents:
+        return valid_chunks, chunk_contents
     return valid_chunks
 
 
@@ -388,9 +564,11 @@ def save_transcripts_to_input_folder(video_info, model, original_file_path=None)
     # Source text directory
     text_dir = os.path.join(chunks_dir, "text" if model == "whisper" else "text_google")
     
-    if not os.path.exists(text_dir):
+    entries = _list_files(text_dir, ".txt")
+    if entries is None:
         logger.warning(f"⚠️  No transcription results found for {video_id}")
         return
+    entries.sort(key=lambda e: e.name)
     
     # Determine the input folder and original filename
     if original_file_path:
@@ -412,12 +590,6 @@ def save_transcripts_to_input_folder(video_info, model, original_file_path=None)
         transcript_filename = f"{original_filename}.txt"
         transcript_file_path = os.path.join(transcription_folder, transcript_filename)
 
-        # Combine all chunks into a single file
-        valid_chunks = combine_chunks_to_single_file(text_dir, transcript_file_path)
-
-        logger.info(f"📄 Saved combined transcript: {transcript_file_path}")
-        logger.info(f"📊 Combined {valid_chunks} chunks into single file")
-
         # Also create the sibling transcripts_{model} directory for detailed chunks
         # Determine the correct location for transcripts folder
         video_dir = video_info.get('video_dir')
@@ -445,16 +617,15 @@ def save_transcripts_to_input_folder(video_info, model, original_file_path=None)
 
         os.makedirs(transcript_dir, exist_ok=True)
 
-        # Copy individual chunk files for detailed reference
-        import shutil
-        text_files = [f for f in os.listdir(text_dir) if f.endswith(".txt")]
-
-        for text_file in text_files:
-            src_path = os.path.join(text_dir, text_file)
-            dst_path = os.path.join(transcript_dir, text_file)
-            shutil.copy2(src_path, dst_path)
+        # Each chunk is read once: the combined writer hands back the contents it
+        # read so the summary preview below doesn't re-open every file
+        valid_chunks, chunk_contents = combine_chunks_to_single_file(
+            text_dir, transcript_file_path, entries=entries, return_contents=True)
+        copy_chunk_files(entries, transcript_dir)
 
-        logger.info(f"📋 Also saved {len(text_files)} individual chunks to: {transcript_dir}")
+        logger.info(f"📄 Saved combined transcript: {transcript_file_path}")
+        logger.info(f"📊 Combined {valid_chunks} chunks into single file")
+        logger.info(f"📋 Also saved {len(entries)} individual chunks to: {transcript_dir}")
 
         # Create a summary file in the transcription folder
         summary_file = os.path.join(transcription_folder, f"{original_filename}_{model}_summary.txt")
@@ -463,22 +634,18 @@ def save_transcripts_to_input_folder(video_info, model, original_file_path=None)
             f.write(f"====================\n\n")
             f.write(f"Source: {original_filename}\n")
             f.write(f"Model: {model}\n")
-            f.write(f"Chunks: {len(text_files)}\n")
+            f.write(f"Chunks: {len(entries)}\n")
             f.write(f"Valid chunks: {valid_chunks}\n")
             f.write(f"Timestamp: {datetime.now()}\n\n")
             f.write(f"Combined transcript saved as: {transcript_filename}\n")
             f.write(f"Individual chunks saved in: {os.path.basename(transcript_dir)}/\n\n")
             
             # Include transcription content preview
-            for text_file in sorted(text_files):
-                text_path = os.path.join(text_dir, text_file)
-                try:
-                    with open(text_path, 'r', encoding='utf-8') as tf:
-                        content = tf.read().strip()
-                        if content:
-                            f.write(f"{text_file}: {content}\n")
-                except Exception as e:
-                    f.write(f"{text_file}: [Error reading file: {e}]\n")
+            for text_file, content in chunk_contents:
+                if content is None:
+                    f.write(f"{text_file}: [Error reading file]\n")
+                elif content:
+                    f.write(f"{text_file}: {content}\n")
 
         logger.info(f"📄 Created summary file: {summary_file}")
 
@@ -496,18 +663,18 @@ def validate_video_structure(video_path):
     Returns:
         Tuple of (is_valid, video_info_dict_or_error_message)
     """
-    if not os.path.isdir(video_path):
-        return False, f"Path is not a directory: {video_path}"
-    
     chunks_dir = os.path.join(video_path, "chunks")
-    if not os.path.exists(chunks_dir):
-        return False, f"Chunks directory not found: {chunks_dir}"
-    
     audio_dir = os.path.join(chunks_dir, "audio")
-    if not os.path.exists(audio_dir):
+    
+    wav_files = _list_files(audio_dir, ".wav")
+    if wav_files is None:
+        # Only work out which level is missing on the (rare) failure path
+        if not os.path.isdir(video_path):
+            return False, f"Path is not a directory: {video_path}"
+        if not os.path.exists(chunks_dir):
+            return False, f"Chunks directory not found: {chunks_dir}"
         return False, f"Audio chunks not found: {audio_dir}"
     
-    wav_files = [f for f in os.listdir(audio_dir) if f.endswith(".wav")]
     if not wav_files:
         return False, f"No .wav files found in: {audio_dir}"
     
@@ -12,20 +12,50 @@ This module provides utilities for tracking transcription progress including:
 
 import os
 import json
+import heapq
 import logging
+import threading
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 
+# Prefer orjson for (de)serialization when available; fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
-# Progress tracking file
-PROGRESS_FILE = os.path.join("logs", "transcription_progress.json")
+# Progress tracking file (resolved once so every save/load hits the same absolute path)
+PROGRESS_FILE = Path("logs", "transcription_progress.json").absolute()
+
+# Set once the progress directory is known to exist, so saves skip the makedirs call
+_progress_dir_ready = False
+
+# Human-readable timestamp format used in progress reports
+DISPLAY_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Held around read-modify-write updates of the progress file (models transcribing
+# side by side update it from different threads); replaced with a multiprocessing
+# lock in batch worker processes (see set_progress_lock)
+_progress_lock = threading.Lock()
+
+
+def set_progress_lock(lock):
+    """Serialize progress file updates with lock, shared by every process writing the file."""
+    global _progress_lock
+    _progress_lock = lock
 
 
 def load_progress():
     """Load transcription progress from file."""
-    if os.path.exists(PROGRESS_FILE):
+    if PROGRESS_FILE.exists():
         try:
+            if ORJSON_AVAILABLE:
+                with open(PROGRESS_FILE, 'rb') as f:
+                    return orjson.loads(f.read())
             with open(PROGRESS_FILE, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except (json.JSONDecodeError, IOError):
@@ -33,47 +63,85 @@ def load_progress():
     
     return {
         "sessions": [],
+        "sessions_index": {},
         "completed_videos": {},
         "last_updated": None
     }
 
 
+def _get_session_index(progress):
+    """
+    Return the session_id -> position index into progress["sessions"].
+    
+    The index is persisted alongside the sessions list; it is rebuilt when
+    missing (older progress files) or out of sync with the list.
+    """
+    index = progress.get("sessions_index")
+    if index is None or len(index) != len(progress["sessions"]):
+        index = {s.get("session_id"): i for i, s in enumerate(progress["sessions"])}
+        progress["sessions_index"] = index
+    return index
+
+
+def _display_time(record, iso_key, display_key):
+    """Return the display timestamp for a record, formatting and caching it on first use."""
+    display = record.get(display_key)
+    if display is None:
+        # Older progress files only store the ISO timestamp
+        display = datetime.fromisoformat(record[iso_key]).strftime(DISPLAY_TIME_FORMAT)
+        record[display_key] = display
+    return display
+
+
 def save_progress(progress_data):
     """Save transcription progress to file."""
+    global _progress_dir_ready
     try:
         progress_data["last_updated"] = datetime.now().isoformat()
-        os.makedirs(os.path.dirname(PROGRESS_FILE), exist_ok=True)
-        with open(PROGRESS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(progress_data, f, indent=2, ensure_ascii=False)
+        if not _progress_dir_ready:
+            PROGRESS_FILE.parent.mkdir(parents=True, exist_ok=True)
+            _progress_dir_ready = True
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(progress_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            with open(PROGRESS_FILE, 'wb') as f:
+                f.write(data)
+        else:
+            with open(PROGRESS_FILE, 'w', encoding='utf-8') as f:
+                json.dump(progress_data, f, indent=2, ensure_ascii=False)
     except IOError as e:
         logger.warning(f"⚠️  Could not save progress: {e}")
 
 
 def update_video_progress(video_id, model, status, chunks_transcribed=0, total_chunks=0):
     """Update progress for a specific video."""
-    progress = load_progress()
-    
-    video_key = f"{video_id}_{model}"
-    progress["completed_videos"][video_key] = {
-        "video_id": video_id,
-        "model": model,
-        "status": status,  # "completed", "partial", "failed", "pending"
-        "chunks_transcribed": chunks_transcribed,
-        "total_chunks": total_chunks,
-        "completion_rate": (chunks_transcribed / total_chunks * 100) if total_chunks > 0 else 0,
-        "last_updated": datetime.now().isoformat()
-    }
-    
-    save_progress(progress)
+    with _progress_lock:
+        progress = load_progress()
+        
+        now = datetime.now()
+        video_key = f"{video_id}_{model}"
+        progress["completed_videos"][video_key] = {
+            "video_id": video_id,
+            "model": model,
+            "status": status,  # "completed", "partial", "failed", "pending"
+            "chunks_transcribed": chunks_transcribed,
+            "total_chunks": total_chunks,
+            "completion_rate": (chunks_transcribed / total_chunks * 100) if total_chunks > 0 else 0,
+            "last_updated": now.isoformat(),
+            "last_updated_display": now.strftime(DISPLAY_TIME_FORMAT)
+        }
+        
+        save_progress(progress)
 
 
 def start_session(session_info):
     """Start a new transcription session and track it."""
     progress = load_progress()
     
+    now = datetime.now()
     session = {
-        "session_id": datetime.now().strftime("%Y%m%d_%H%M%S"),
-        "start_time": datetime.now().isoformat(),
+        "session_id": now.strftime("%Y%m%d_%H%M%S"),
+        "start_time": now.isoformat(),
+        "start_time_display": now.strftime(DISPLAY_TIME_FORMAT),
         "end_time": None,
         "model": session_info.get("model"),
         "mode": session_info.get("mode"),  # "single", "batch"
@@ -86,7 +154,9 @@ def start_session(session_info):
         "status": "running"
     }
     
+    index = _get_session_index(progress)
     progress["sessions"].append(session)
+    index[session["session_id"]] = len(progress["sessions"]) - 1
     save_progress(progress)
     
     logger.info(f"📊 Started session: {session['session_id']}")
@@ -97,19 +167,19 @@ def end_session(session_id, final_stats):
     """End a transcription session and update final statistics."""
     progress = load_progress()
     
-    for session in progress["sessions"]:
-        if session.get("session_id") == session_id:
-            session.update({
-                "end_time": datetime.now().isoformat(),
-                "videos_processed": final_stats.get("videos_processed", 0),
-                "videos_successful": final_stats.get("videos_successful", 0),
-                "videos_failed": final_stats.get("videos_failed", 0),
-                "total_chunks": final_stats.get("total_chunks", 0),
-                "chunks_transcribed": final_stats.get("chunks_transcribed", 0),
-                "status": "completed",
-                "duration_seconds": final_stats.get("duration_seconds", 0)
-            })
-            break
+    position = _get_session_index(progress).get(session_id)
+    if position is not None:
+        session = progress["sessions"][position]
+        session.update({
+            "end_time": datetime.now().isoformat(),
+            "videos_processed": final_stats.get("videos_processed", 0),
+            "videos_successful": final_stats.get("videos_successful", 0),
+            "videos_failed": final_stats.get("videos_failed", 0),
+            "total_chunks": final_stats.get("total_chunks", 0),
+            "chunks_transcribed": final_stats.get("chunks_transcribed", 0),
+            "status": "completed",
+            "duration_seconds": final_stats.get("duration_seconds", 0)
+        })
     
     save_progress(progress)
     logger.info(f"📊 Ended session: {session_id}")
@@ -135,64 +205,81 @@ def get_session_stats():
 
 def show_progress_history():
     """Display detailed progress history and statistics."""
+    # Nothing below is visible unless INFO is enabled, so skip the formatting work too
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     progress = load_progress()
     
-    logger.info("=" * 70)
-    logger.info("📊 TRANSCRIPTION PROGRESS HISTORY")
-    logger.info("=" * 70)
+    lines = [
+        "=" * 70,
+        "📊 TRANSCRIPTION PROGRESS HISTORY",
+        "=" * 70,
+    ]
     
     if not progress["sessions"]:
-        logger.info("📋 No transcription sessions found.")
+        lines.append("📋 No transcription sessions found.")
+        logger.info("\n".join(lines))
         return
     
     # Overall statistics
     stats = get_session_stats()
-    logger.info(f"🔄 Total sessions: {stats['total_sessions']}")
-    logger.info(f"✅ Completed sessions: {stats['completed_sessions']}")
-    logger.info(f"🎯 Total videos processed: {stats['total_videos_processed']}")
-    logger.info(f"📈 Overall success rate: {stats['success_rate']:.1f}%")
-    logger.info(f"📅 Last updated: {progress.get('last_updated', 'Never')}")
-    
-    logger.info("\n" + "─" * 70)
-    logger.info("📋 RECENT SESSIONS")
-    logger.info("─" * 70)
+    lines += [
+        f"🔄 Total sessions: {stats['total_sessions']}",
+        f"✅ Completed sessions: {stats['completed_sessions']}",
+        f"🎯 Total videos processed: {stats['total_videos_processed']}",
+        f"📈 Overall success rate: {stats['success_rate']:.1f}%",
+        f"📅 Last updated: {progress.get('last_updated', 'Never')}",
+        "\n" + "─" * 70,
+        "📋 RECENT SESSIONS",
+        "─" * 70,
+    ]
     
     # Show last 10 sessions
-    recent_sessions = sorted(progress["sessions"], 
-                           key=lambda x: x.get("start_time", ""), 
-                           reverse=True)[:10]
+    recent_sessions = heapq.nlargest(10, progress["sessions"],
+                                     key=lambda x: x.get("start_time", ""))
     
     for session in recent_sessions:
-        start_time = datetime.fromisoformat(session["start_time"]).strftime("%Y-%m-%d %H:%M:%S")
+        start_time = _display_time(session, "start_time", "start_time_display")
         duration = "Running..." if session.get("status") == "running" else f"{session.get('duration_seconds', 0):.1f}s"
         
-        logger.info(f"🗓️  {session['session_id']} | {start_time}")
-        logger.info(f"   📱 Model: {session.get('model', 'N/A')} | Mode: {session.get('mode', 'N/A')}")
-        logger.info(f"   📊 Videos: {session.get('videos_successful', 0)}/{session.get('videos_processed', 0)} | Duration: {duration}")
-        logger.info(f"   📁 Path: {session.get('target_path', 'N/A')}")
-        logger.info("")
+        lines += [
+            f"🗓️  {session['session_id']} | {start_time}",
+            f"   📱 Model: {session.get('model', 'N/A')} | Mode: {session.get('mode', 'N/A')}",
+            f"   📊 Videos: {session.get('videos_successful', 0)}/{session.get('videos_processed', 0)} | Duration: {duration}",
+            f"   📁 Path: {session.get('target_path', 'N/A')}",
+            "",
+        ]
     
     # Show video completion status
     if progress["completed_videos"]:
-        logger.info("─" * 70)
-        logger.info("🎬 VIDEO COMPLETION STATUS")
-        logger.info("─" * 70)
+        lines += [
+            "─" * 70,
+            "🎬 VIDEO COMPLETION STATUS",
+            "─" * 70,
+        ]
+        
+        status_emoji = {"completed": "✅", "partial": "⚠️", "failed": "❌", "pending": "⏳"}
         
-        for video_key, video_data in list(progress["completed_videos"].items())[-20:]:  # Last 20 videos
-            status_emoji = {"completed": "✅", "partial": "⚠️", "failed": "❌", "pending": "⏳"}
+        # Last 20 videos, in insertion order, without materializing the whole history
+        recent_videos = list(islice(reversed(progress["completed_videos"].items()), 20))[::-1]
+        for video_key, video_data in recent_videos:
             emoji = status_emoji.get(video_data["status"], "❓")
             
-            logger.info(f"{emoji} {video_data['video_id']} ({video_data['model']})")
-            logger.info(f"   📊 {video_data['chunks_transcribed']}/{video_data['total_chunks']} chunks ({video_data['completion_rate']:.1f}%)")
-            logger.info(f"   📅 {datetime.fromisoformat(video_data['last_updated']).strftime('%Y-%m-%d %H:%M:%S')}")
+            lines += [
+                f"{emoji} {video_data['video_id']} ({video_data['model']})",
+                f"   📊 {video_data['chunks_transcribed']}/{video_data['total_chunks']} chunks ({video_data['completion_rate']:.1f}%)",
+                f"   📅 {_display_time(video_data, 'last_updated', 'last_updated_display')}",
+            ]
     
-    logger.info("=" * 70)
+    lines.append("=" * 70)
+    logger.info("\n".join(lines))
 
 
 def clear_progress_history():
     """Clear all progress history data."""
     try:
-        if os.path.exists(PROGRESS_FILE):
+        if PROGRESS_FILE.exists():
             # Create backup before clearing
             backup_file = f"{PROGRESS_FILE}.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             os.rename(PROGRESS_FILE, backup_file)
@@ -201,6 +288,7 @@ def clear_progress_history():
         # Initialize fresh progress file
         fresh_progress = {
             "sessions": [],
+            "sessions_index": {},
             "completed_videos": {},
             "last_updated": datetime.now().isoformat()
         }
@@ -1,11 +1,117 @@
 import cv2
+import multiprocessing
 import numpy as np
-from moviepy.editor import VideoFileClip
 import os
-from .face_detection import detect_faces_in_frame
+import queue
+import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from itertools import islice
+from .face_detection import (
+    CudaFaceCascade, YuNetFaceDetector, detect_faces_in_frame, get_face_detector, iter_sampled_frames,
+    open_video_capture, prepare_frame_for_detection
+)
 
+# Frames decoded ahead and handed to the detection pool at a time (bounds memory)
+DETECTION_BATCH_SIZE = 64
 
-def analyze_face_timeline_in_chunk(video_path, start_time, end_time, sample_rate=0.1):
+# Frames buffered between the decode thread and face detection
+DECODE_QUEUE_SIZE = 32
+
+# Consecutive samples whose thumbnails differ by less than this mean gray level
+# reuse the previous detection result, for at most FRAME_REUSE_MAX_SKIP samples in a row
+FRAME_REUSE_THRESHOLD = 2.0
+FRAME_REUSE_MAX_SKIP = 4
+FRAME_SIGNATURE_SIZE = (32, 18)
+
+# The pool is created while capture and decode threads are running, and forking a
+# threaded process can deadlock the children, so workers are started without fork
+DETECTION_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+
+def _init_detection_worker():
+    """Load the face detector once per worker process instead of pickling it."""
+    cv2.setNumThreads(1)  # the pool already provides the parallelism
+    get_face_detector()
+
+
+def _frame_has_face(prepared):
+    """Run face detection on one (frame, scale) prepared frame inside a detection worker."""
+    frame, scale = prepared
+    return len(detect_faces_in_frame(frame, get_face_detector(), frame_scale=scale)) > 0
+
+
+def _frame_signature(frame):
+    """Tiny grayscale thumbnail used to spot near-identical consecutive samples."""
+    gray = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+    return cv2.resize(gray, FRAME_SIGNATURE_SIZE, interpolation=cv2.INTER_AREA).astype(np.int16)
+
+
+def create_detection_pool(max_workers=None):
+    """Create a process pool for parallel per-frame face detection."""
+    return ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                               mp_context=multiprocessing.get_context(DETECTION_START_METHOD),
+                               initializer=_init_detection_worker)
+
+
+def iter_prefetched(items, maxsize=DECODE_QUEUE_SIZE):
+    """
+    Consume an iterator on a background thread, yielding its items through a bounded queue.
+    
+    Used to keep the decoder busy while the caller runs face detection; OpenCV
+    releases the GIL in both, so the two stages overlap. Exceptions raised by
+    the iterator are re-raised in the caller.
+    
+    Args:
+        items: Iterator to consume (only touched by the background thread)
+        maxsize: Maximum number of items buffered ahead of the caller
+    
+    Yields:
+        Items of the iterator, in order
+    """
+    buffer = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+    errors = []
+    done = object()
+    
+    def put(item):
+        # Give up if the caller stopped consuming (e.g. it raised)
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+    
+    def produce():
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except Exception as e:
+            errors.append(e)
+        put(done)
+    
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is done:
+                break
+            yield item
+        if errors:
+            raise errors[0]
+    finally:
+        stop.set()
+        producer.join()
+
+
+def analyze_face_timeline_in_chunk(video_path, start_time, end_time, sample_rate=0.1, capture=None,
+                                   detection_pool=None, min_segment_duration=None, max_gap=0.3,
+                                   reuse_threshold=FRAME_REUSE_THRESHOLD):
     """
     Analyze face presence throughout a chunk timeline with high resolution.
     
@@ -14,83 +120,152 @@ def analyze_face_timeline_in_chunk(video_path, start_time, end_time, sample_rate
         start_time: Start time of chunk in seconds
         end_time: End time of chunk in seconds
         sample_rate: How often to sample (in seconds) for face detection
+        capture: Optional already-opened cv2.VideoCapture for video_path, shared
+                 across chunks so the video is decoded in one forward pass
+        detection_pool: Optional pool from create_detection_pool(); frames are decoded
+                        here and face detection is fanned out to the pool's workers
+        min_segment_duration: If set, stop sampling once no remaining sample can be part
+                              of a face segment at least this long (see find_face_segments)
+        max_gap: Gap tolerance used to track face segments for the early stop
+        reuse_threshold: Reuse the previous detection result for samples whose thumbnail
+                         differs from it by less than this mean gray level (None disables)
     
     Returns:
-        List of (timestamp, has_face) tuples
+        (timestamps, has_face) parallel arrays: float64 sample times and a bool
+        face-presence flag per sample (truncated if the video ends early or
+        sampling stopped early)
     """
-    video = VideoFileClip(video_path)
-    face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+    owns_capture = capture is None
+    if owns_capture:
+        capture = open_video_capture(video_path)
     
     # Sample at high resolution within the chunk
     sample_times = np.arange(start_time, end_time, sample_rate)
-    face_timeline = []
-    
-    for t in sample_times:
-        if t >= video.duration:
-            break
-            
-        frame = video.get_frame(t)
-        faces = detect_faces_in_frame(frame, face_cascade)
-        has_face = len(faces) > 0
-        face_timeline.append((t, has_face))
+    has_face = np.zeros(len(sample_times), dtype=bool)
+    count = 0
+    
+    # Follow the face segment being sampled with the same gap rule as
+    # find_face_segments. Once even the longest segment the remaining samples
+    # could still join or start would be shorter than min_segment_duration,
+    # the rest of the chunk cannot change the refinement result
+    last_sample_time = sample_times[-1] if len(sample_times) else 0.0
+    segment_start = None
+    last_face_time = None
     
-    video.close()
-    return face_timeline
+    def keep_sampling(index):
+        nonlocal segment_start, last_face_time
+        t = sample_times[index]
+        if has_face[index]:
+            if segment_start is None:
+                segment_start = t
+            last_face_time = t
+        elif segment_start is not None and t - last_face_time > max_gap:
+            segment_start = None
+        if min_segment_duration is None or index + 1 >= len(sample_times):
+            return True
+        earliest_start = segment_start if segment_start is not None else sample_times[index + 1]
+        return last_sample_time - earliest_start >= min_segment_duration
+    
+    # Samples 0.1s apart within one shot are near-identical: while a sample's
+    # thumbnail stays close to the last detected one, copy that result instead
+    # of running detection again (re-detecting at least every few samples)
+    reference_signature = None
+    reference_index = None
+    reused = 0
+    
+    def reuse_source(index, signature):
+        nonlocal reference_signature, reference_index, reused
+        if (reuse_threshold is not None and reference_signature is not None
+                and reused < FRAME_REUSE_MAX_SKIP
+                and np.mean(np.abs(signature - reference_signature)) < reuse_threshold):
+            reused += 1
+            return reference_index
+        reference_signature, reference_index, reused = signature, index, 0
+        return None
+    
+    try:
+        samples = iter_sampled_frames(capture, sample_times)
+        if detection_pool is not None:
+            # Decode and shrink on a background thread (small frames are cheap to
+            # send; gray unless YuNet needs color) while the pool detects, one bounded batch at a time
+            grayscale = not isinstance(get_face_detector(), YuNetFaceDetector)
+            prepared = ((frame_scale, _frame_signature(frame_scale[0]))
+                        for frame_scale in (prepare_frame_for_detection(frame, grayscale=grayscale)
+                                            for _, frame in samples))
+            with closing(iter_prefetched(prepared)) as prefetched:
+                sampling = True
+                while sampling:
+                    batch = list(islice(prefetched, DETECTION_BATCH_SIZE))
+                    if not batch:
+                        break
+                    sources = [reuse_source(count + i, signature) for i, (_, signature) in enumerate(batch)]
+                    to_detect = [i for i, source in enumerate(sources) if source is None]
+                    results = detection_pool.map(_frame_has_face, [batch[i][0] for i in to_detect], chunksize=16)
+                    for i, result in zip(to_detect, results):
+                        has_face[count + i] = result
+                    for i, source in enumerate(sources):
+                        if source is not None:
+                            has_face[count + i] = has_face[source]
+                    for _ in batch:
+                        count += 1
+                        if not keep_sampling(count - 1):
+                            sampling = False
+                            break
+        else:
+            # Decode on a background thread while this thread runs detection
+            face_cascade = get_face_detector()
+            with closing(iter_prefetched((frame, _frame_signature(frame)) for _, frame in samples)) as prefetched:
+                for frame, signature in prefetched:
+                    source = reuse_source(count, signature)
+                    if source is None:
+                        faces = detect_faces_in_frame(frame, face_cascade)
+                        has_face[count] = len(faces) > 0
+                    else:
+                        has_face[count] = has_face[source]
+                    count += 1
+                    if not keep_sampling(count - 1):
+                        break
+    finally:
+        if owns_capture:
+            capture.release()
+    
+    # Samples are yielded in order; any past the end of the video were never decoded
+    return sample_times[:count], has_face[:count]
 
 
-def find_face_segments(face_timeline, min_face_duration=0.5, max_gap=0.3):
+def find_face_segments(timestamps, has_face, min_face_duration=0.5, max_gap=0.3):
     """
     Find continuous segments where faces are present, allowing small gaps.
     
     Args:
-        face_timeline: List of (timestamp, has_face) tuples
+        timestamps: Sorted sample times (array from analyze_face_timeline_in_chunk)
+        has_face: Per-sample face presence flags, parallel to timestamps
         min_face_duration: Minimum duration for a face segment to be valid
         max_gap: Maximum allowed gap without face (e.g., for blinks) in seconds
     
     Returns:
         List of (start_time, end_time) tuples for face segments
     """
-    if not face_timeline:
+    face_indices = np.flatnonzero(has_face)
+    if len(face_indices) == 0:
         return []
     
-    face_segments = []
-    current_start = None
-    last_face_time = None
+    # A segment ends between two consecutive face samples when the last no-face
+    # sample before the next face is more than max_gap after the previous face
+    # (small gaps for blinks etc. are bridged)
+    prev_face, next_face = face_indices[:-1], face_indices[1:]
+    breaks = (next_face > prev_face + 1) & (timestamps[next_face - 1] - timestamps[prev_face] > max_gap)
     
-    for i, (timestamp, has_face) in enumerate(face_timeline):
-        if has_face:
-            if current_start is None:
-                # Start of a new face segment
-                current_start = timestamp
-                last_face_time = timestamp
-            else:
-                # Continue existing segment
-                last_face_time = timestamp
-        else:
-            # No face detected
-            if current_start is not None:
-                # Check if gap is too large
-                gap = timestamp - last_face_time
-                if gap > max_gap:
-                    # Gap is too large - end current segment
-                    duration = last_face_time - current_start
-                    if duration >= min_face_duration:
-                        face_segments.append((current_start, last_face_time))
-                    current_start = None
-                    last_face_time = None
-                # else: small gap, continue the segment
-    
-    # Handle case where chunk ends with faces
-    if current_start is not None and last_face_time is not None:
-        duration = last_face_time - current_start
-        if duration >= min_face_duration:
-            face_segments.append((current_start, last_face_time))
-    
-    return face_segments
+    segment_starts = timestamps[face_indices[np.concatenate(([True], breaks))]]
+    segment_ends = timestamps[face_indices[np.concatenate((breaks, [True]))]]
+    
+    keep = segment_ends - segment_starts >= min_face_duration
+    return list(zip(segment_starts[keep].tolist(), segment_ends[keep].tolist()))
 
 
 def refine_chunk_by_faces(video_path, start_time, end_time, sample_rate=0.1, 
-                         min_face_duration=0.5, min_chunk_duration=1.0, max_gap=0.3):
+                         min_face_duration=0.5, min_chunk_duration=1.0, max_gap=0.3,
+                         capture=None, detection_pool=None):
     """
     Refine a chunk to only include segments with faces.
     
@@ -102,6 +277,8 @@ def refine_chunk_by_faces(video_path, start_time, end_time, sample_rate=0.1,
         min_face_duration: Minimum duration for face segments
         min_chunk_duration: Minimum duration for refined chunks
         max_gap: Maximum gap without face to tolerate (seconds)
+        capture: Optional already-opened cv2.VideoCapture for video_path
+        detection_pool: Optional pool from create_detection_pool() for parallel detection
     
     Returns:
         List of refined (start_time, end_time) tuples with faces only
@@ -109,14 +286,18 @@ def refine_chunk_by_faces(video_path, start_time, end_time, sample_rate=0.1,
     print(f"  Refining chunk {start_time:.2f}s - {end_time:.2f}s...")
     
     # Analyze face presence throughout the chunk
-    face_timeline = analyze_face_timeline_in_chunk(video_path, start_time, end_time, sample_rate)
+    timestamps, has_face = analyze_face_timeline_in_chunk(video_path, start_time, end_time, sample_rate,
+                                                          capture=capture, detection_pool=detection_pool,
+                                                          min_segment_duration=max(min_chunk_duration,
+                                                                                   min_face_duration),
+                                                          max_gap=max_gap)
     
-    if not face_timeline:
+    if len(timestamps) == 0:
         print(f"    ❌ No timeline data - removing chunk")
         return []
     
     # Find continuous face segments (allowing small gaps for blinks, etc.)
-    face_segments = find_face_segments(face_timeline, min_face_duration, max_gap)
+    face_segments = find_face_segments(timestamps, has_face, min_face_duration, max_gap)
     
     if not face_segments:
         print(f"    ❌ No face segments found - removing chunk")
@@ -126,18 +307,22 @@ def refine_chunk_by_faces(video_path, start_time, end_time, sample_rate=0.1,
     valid_segments = []
     min_face_percentage = 0.95  # Require 95% face presence for benchmarking dataset
     
+    # The timeline is sorted by time: locate each segment by bisection and count
+    # face samples with a prefix sum instead of rescanning the timeline per segment
+    faces_before = np.concatenate(([0], np.cumsum(has_face)))
+    
     for seg_start, seg_end in face_segments:
         duration = seg_end - seg_start
         if duration < min_chunk_duration:
             continue
             
         # Calculate face presence percentage in this segment
-        segment_timeline = [(t, has_face) for t, has_face in face_timeline 
-                          if seg_start <= t <= seg_end]
+        lo = np.searchsorted(timestamps, seg_start, side='left')
+        hi = np.searchsorted(timestamps, seg_end, side='right')
         
-        if segment_timeline:
-            faces_present = sum(1 for _, has_face in segment_timeline if has_face)
-            face_percentage = faces_present / len(segment_timeline)
+        if hi > lo:
+            faces_present = faces_before[hi] - faces_before[lo]
+            face_percentage = faces_present / (hi - lo)
             
             if face_percentage >= min_face_percentage:
                 valid_segments.append((seg_start, seg_end))
@@ -165,7 +350,8 @@ def refine_chunk_by_faces(video_path, start_time, end_time, sample_rate=0.1,
 
 def refine_all_chunks_by_faces(video_path, timestamps, sample_rate=0.1, 
                               min_face_duration=0.5, min_chunk_duration=1.0, 
-                              max_gap=0.3, show_progress=True):
+                              max_gap=0.3, show_progress=True, detection_workers=None,
+                              use_gpu_decode=True):
     """
     Refine all chunks to only include face segments.
     
@@ -177,6 +363,8 @@ def refine_all_chunks_by_faces(video_path, timestamps, sample_rate=0.1,
         min_chunk_duration: Minimum duration for refined chunks
         max_gap: Maximum gap without face to tolerate (seconds)
         show_progress: Whether to show progress
+        detection_workers: Number of face detection processes (default: CPU count)
+        use_gpu_decode: Decode the video on the GPU when a hardware decoder is available
     
     Returns:
         List of refined timestamps with only face segments
@@ -190,18 +378,30 @@ def refine_all_chunks_by_faces(video_path, timestamps, sample_rate=0.1,
     
     refined_timestamps = []
     
-    for i, (start, end) in enumerate(timestamps):
-        if show_progress and i % 10 == 0:
-            print(f"\nProcessing chunk {i+1}/{len(timestamps)}...")
-        
-        # Refine this chunk
-        face_segments = refine_chunk_by_faces(
-            video_path, start, end, sample_rate, 
-            min_face_duration, min_chunk_duration, max_gap
-        )
-        
-        # Add all valid face segments
-        refined_timestamps.extend(face_segments)
+    # Open the video once for all chunks: chunks come in time order, so sampling
+    # walks forward through a single decoder instead of reopening it per chunk
+    # Haar detection is CPU bound and independent per frame: fan it out to a
+    # process pool that lives for the whole refinement pass (unless it runs on the GPU)
+    capture = open_video_capture(video_path, use_gpu_decode)
+    detection_pool = None if isinstance(get_face_detector(), CudaFaceCascade) else create_detection_pool(detection_workers)
+    try:
+        for i, (start, end) in enumerate(timestamps):
+            if show_progress and i % 10 == 0:
+                print(f"\nProcessing chunk {i+1}/{len(timestamps)}...")
+            
+            # Refine this chunk
+            face_segments = refine_chunk_by_faces(
+                video_path, start, end, sample_rate, 
+                min_face_duration, min_chunk_duration, max_gap,
+                capture=capture, detection_pool=detection_pool
+            )
+            
+            # Add all valid face segments
+            refined_timestamps.extend(face_segments)
+    finally:
+        if detection_pool is not None:
+            detection_pool.shutdown()
+        capture.release()
     
     print(f"\n🎯 Refinement results:")
     print(f"  Original chunks: {len(timestamps)}")
@@ -218,6 +418,35 @@ def refine_all_chunks_by_faces(video_path, timestamps, sample_rate=0.1,
     return refined_timestamps
 
 
+def read_frame_at(video_path, t, width, height):
+    """
+    Grab a single frame at time t, scaled to width x height, by piping raw BGR from ffmpeg.
+    
+    Args:
+        video_path: Path to the video file
+        t: Timestamp in seconds (ffmpeg seeks to the nearest keyframe, then decodes forward)
+        width: Output frame width
+        height: Output frame height
+    
+    Returns:
+        BGR frame as a (height, width, 3) uint8 array, or None if no frame could be read
+    """
+    frame_size = width * height * 3
+    result = subprocess.run([
+        'ffmpeg', '-v', 'error',
+        '-ss', f'{t:.3f}',
+        '-i', video_path,
+        '-frames:v', '1',
+        '-vf', f'scale={width}:{height}',
+        '-f', 'rawvideo',
+        '-pix_fmt', 'bgr24',
+        '-'
+    ], capture_output=True)
+    if result.returncode != 0 or len(result.stdout) < frame_size:
+        return None
+    return np.frombuffer(result.stdout, dtype=np.uint8, count=frame_size).reshape(height, width, 3).copy()
+
+
 def save_refinement_preview(video_path, original_timestamps, refined_timestamps, 
                            output_dir, max_previews=3):
     """
@@ -233,8 +462,7 @@ def save_refinement_preview(video_path, original_timestamps, refined_timestamps,
     preview_dir = os.path.join(output_dir, "refinement_previews")
     os.makedirs(preview_dir, exist_ok=True)
     
-    video = VideoFileClip(video_path)
-    face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+    face_cascade = get_face_detector()
     
     for i in range(min(len(original_timestamps), max_previews)):
         orig_start, orig_end = original_timestamps[i]
@@ -255,23 +483,23 @@ def save_refinement_preview(video_path, original_timestamps, refined_timestamps,
         
         # Original chunk (top half)
         orig_mid = (orig_start + orig_end) / 2
-        orig_frame = video.get_frame(orig_mid).copy()
-        orig_frame = cv2.resize(orig_frame, (fig_width, fig_height))
-        faces = detect_faces_in_frame(orig_frame, face_cascade)
-        for (x, y, w, h) in faces:
-            cv2.rectangle(orig_frame, (x, y), (x+w, y+h), (0, 255, 0), 2)
-        comparison_img[:fig_height] = orig_frame
+        orig_frame = read_frame_at(video_path, orig_mid, fig_width, fig_height)
+        if orig_frame is not None:
+            faces = detect_faces_in_frame(cv2.cvtColor(orig_frame, cv2.COLOR_BGR2RGB), face_cascade)
+            for (x, y, w, h) in faces:
+                cv2.rectangle(orig_frame, (x, y), (x+w, y+h), (0, 255, 0), 2)
+            comparison_img[:fig_height] = orig_frame
         
         # Refined segment (bottom half)
         if refined_segments:
             ref_start, ref_end = refined_segments[0]  # Show first refined segment
             ref_mid = (ref_start + ref_end) / 2
-            ref_frame = video.get_frame(ref_mid).copy()
-            ref_frame = cv2.resize(ref_frame, (fig_width, fig_height))
-            faces = detect_faces_in_frame(ref_frame, face_cascade)
-            for (x, y, w, h) in faces:
-                cv2.rectangle(ref_frame, (x, y), (x+w, y+h), (0, 255, 0), 2)
-            comparison_img[fig_height:] = ref_frame
+            ref_frame = read_frame_at(video_path, ref_mid, fig_width, fig_height)
+            if ref_frame is not None:
+                faces = detect_faces_in_frame(cv2.cvtColor(ref_frame, cv2.COLOR_BGR2RGB), face_cascade)
+                for (x, y, w, h) in faces:
+                    cv2.rectangle(ref_frame, (x, y), (x+w, y+h), (0, 255, 0), 2)
+                comparison_img[fig_height:] = ref_frame
         
         # Add text labels
         cv2.putText(comparison_img, f"Original: {orig_start:.1f}s-{orig_end:.1f}s", 
@@ -286,5 +514,4 @@ def save_refinement_preview(video_path, original_timestamps, refined_timestamps,
         preview_path = os.path.join(preview_dir, f"refinement_{i:03d}.jpg")
         cv2.imwrite(preview_path, comparison_img)
     
-    video.close()
     print(f"Saved {min(len(original_timestamps), max_previews)} refinement previews in {preview_dir}")
@@ -48,19 +48,28 @@ def reorganize_transcripts(experiment_dir, model='google'):
     total_moved = 0
     total_summary_moved = 0
     
+    # A same-filesystem move is a single rename; shutil.move is only needed
+    # (and only pays for its probing and copy fallback) across devices
+    transcript_dev = os.stat(transcript_dir).st_dev
+    
     for video_subdir in video_dirs:
         video_path = os.path.join(experiment_dir, video_subdir)
         
-        if not os.path.exists(video_path):
+        try:
+            entries = list(os.scandir(video_path))
+        except FileNotFoundError:
             continue
         
         print(f"\n📂 Processing: {video_subdir}/")
         
+        move = os.replace if os.stat(video_path).st_dev == transcript_dev else shutil.move
+        
         # Find all transcript files (.txt files, excluding summary files)
         txt_files = []
         summary_files = []
         
-        for file in os.listdir(video_path):
+        for entry in entries:
+            file = entry.name
             if file.endswith('.txt'):
                 if f'_{model}_summary.txt' in file:
                     summary_files.append(file)
@@ -78,7 +87,7 @@ def reorganize_transcripts(experiment_dir, model='google'):
             dst_path = os.path.join(transcript_dir, txt_file)
             
             try:
-                shutil.move(src_path, dst_path)
+                move(src_path, dst_path)
                 moved_count += 1
             except Exception as e:
                 print(f"   ⚠️  Error moving {txt_file}: {e}")
@@ -1,34 +1,120 @@
 # utils/slice_video_by_silence.py
-from pydub import AudioSegment, silence
-from moviepy.editor import VideoFileClip
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import os
+import subprocess
+import threading
+
+SAMPLE_RATE = 16000
+
+# Caps concurrent ffmpeg runs across all callers; more parallel demux/mux jobs
+# than this just contend for the disk
+_ffmpeg_slots = threading.BoundedSemaphore(min(os.cpu_count() or 1, 4))
+
+
+def _read_pcm(video_path):
+    # Decode the audio track straight to 16-bit mono PCM on ffmpeg's stdout
+    with _ffmpeg_slots:
+        result = subprocess.run([
+            'ffmpeg', '-v', 'error',
+            '-vn', '-sn', '-dn',  # input options: skip non-audio streams at the demuxer
+            '-i', video_path,
+            '-f', 's16le',
+            '-ac', '1',
+            '-ar', str(SAMPLE_RATE),
+            '-'
+        ], capture_output=True, check=True)
+    return result.stdout
+
+
+def _split_on_silence(samples, min_silence_len, silence_thresh, keep_silence=100):
+    # Same (start_ms, end_ms) chunk ranges as pydub.silence.split_on_silence, but the
+    # RMS of every min_silence_len window (1 ms hop) comes from one cumulative sum
+    # of squared samples instead of a Python-level slice + rms per millisecond
+    samples_per_ms = SAMPLE_RATE // 1000
+    length = len(samples) // samples_per_ms
+
+    silent_ranges = []
+    if length >= min_silence_len:
+        energy = samples[:length * samples_per_ms].astype(np.int64) ** 2
+        energy_before = np.concatenate(([0], np.cumsum(energy.reshape(length, samples_per_ms).sum(axis=1))))
+        window_energy = energy_before[min_silence_len:] - energy_before[:-min_silence_len]
+        rms = np.floor(np.sqrt(window_energy / (min_silence_len * samples_per_ms)))
+        threshold = 10 ** (silence_thresh / 20) * 32768
+        silence_starts = np.flatnonzero(rms <= threshold)
+
+        if len(silence_starts):
+            # Silent windows starting within min_silence_len of each other form one range
+            breaks = np.flatnonzero(np.diff(silence_starts) > min_silence_len)
+            range_starts = silence_starts[np.concatenate(([0], breaks + 1))]
+            range_ends = silence_starts[np.concatenate((breaks, [len(silence_starts) - 1]))] + min_silence_len
+            silent_ranges = list(zip(range_starts.tolist(), range_ends.tolist()))
+
+    # Invert to non-silent ranges
+    if not silent_ranges:
+        nonsilent_ranges = [[0, length]]
+    elif silent_ranges[0] == (0, length):
+        nonsilent_ranges = []
+    else:
+        nonsilent_ranges = []
+        prev_end = 0
+        for start, end in silent_ranges:
+            nonsilent_ranges.append([prev_end, start])
+            prev_end = end
+        if prev_end != length:
+            nonsilent_ranges.append([prev_end, length])
+        if nonsilent_ranges[0] == [0, 0]:
+            nonsilent_ranges.pop(0)
+
+    # Pad with keep_silence, splitting any overlap between neighbours down the middle
+    output_ranges = [[start - keep_silence, end + keep_silence] for start, end in nonsilent_ranges]
+    for current, following in zip(output_ranges, output_ranges[1:]):
+        if following[0] < current[1]:
+            current[1] = (current[1] + following[0]) // 2
+            following[0] = current[1]
+
+    return [(max(start, 0), min(end, length)) for start, end in output_ranges]
+
+
+def _export_chunk(video_path, start, end, out_path):
+    # Each chunk is its own ffmpeg process, so chunks can be exported concurrently.
+    # Streams are copied, not re-encoded: cuts snap to the nearest keyframe
+    with _ffmpeg_slots:
+        subprocess.run([
+            'ffmpeg', '-y', '-v', 'error',
+            '-ss', str(start),
+            '-i', video_path,
+            '-t', str(end - start),
+            '-c:v', 'copy',
+            '-c:a', 'copy',
+            '-avoid_negative_ts', 'make_zero',
+            out_path
+        ], check=True)
+
 
 def split_video_by_silence(video_path, output_dir, min_silence_len=700, silence_thresh=-40):
     os.makedirs(output_dir, exist_ok=True)
 
-    # Extract audio and convert to wav
-    video = VideoFileClip(video_path)
-    audio = video.audio
-    audio_path = os.path.join(output_dir, "temp_audio.wav")
-    audio.write_audiofile(audio_path, fps=16000, nbytes=2, codec="pcm_s16le")
-
-    # Load with pydub
-    audio_seg = AudioSegment.from_wav(audio_path)
-    chunks = silence.split_on_silence(audio_seg, min_silence_len=min_silence_len, silence_thresh=silence_thresh)
+    # Extract audio into memory (no intermediate wav file)
+    samples = np.frombuffer(_read_pcm(video_path), dtype=np.int16)
+    chunks = _split_on_silence(samples, min_silence_len=min_silence_len, silence_thresh=silence_thresh)
 
     timestamps = []
     cursor = 0
-    for i, chunk in enumerate(chunks):
+    for i, (chunk_start, chunk_end) in enumerate(chunks):
         start = cursor
-        end = start + len(chunk)
+        end = start + (chunk_end - chunk_start)
         timestamps.append((start / 1000, end / 1000))  # convert to seconds
         cursor = end
 
-    # Slice video using moviepy
-    for idx, (start, end) in enumerate(timestamps):
-        subclip = video.subclip(start, end)
-        out_path = os.path.join(output_dir, f"chunk_{idx:03d}.mp4")
-        subclip.write_videofile(out_path, codec="libx264", audio_codec="aac", verbose=False, logger=None)
+    # Slice video with one ffmpeg run per chunk (concurrency capped by _ffmpeg_slots)
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        futures = [
+            pool.submit(_export_chunk, video_path, start, end, os.path.join(output_dir, f"chunk_{idx:03d}.mp4"))
+            for idx, (start, end) in enumerate(timestamps)
+        ]
+        for future in futures:
+            future.result()
 
     print(f"✅ Sliced {len(timestamps)} video segments into: {output_dir}")
-    return timestamps
\ No newline at end of file
+    return timestamps
@@ -2,7 +2,8 @@ from pydub import AudioSegment
 from pydub.silence import split_on_silence
 import os
 
-def split_audio_on_silence(audio_path, output_dir, min_silence_len=700, silence_thresh=-40, keep_silence=300):
+def split_audio_on_silence(audio_path, output_dir, min_silence_len=700, silence_thresh=-40, keep_silence=300,
+                           seek_step=50):
     """
     Splits the audio based on silence and saves the chunks.
     
@@ -10,6 +11,7 @@ def split_audio_on_silence(audio_path, output_dir, min_silence_len=700, silence_
     - min_silence_len: minimum length of silence (in ms) that will be used to split.
     - silence_thresh: silence threshold in dBFS (decibels relative to full scale).
     - keep_silence: amount of silence to leave at the beginning and end of each chunk.
+    - seek_step: step (in ms) between silence checks; larger is faster but less precise.
     """
     # Load the audio file
     audio = AudioSegment.from_wav(audio_path)
@@ -19,7 +21,8 @@ def split_audio_on_silence(audio_path, output_dir, min_silence_len=700, silence_
         audio,
         min_silence_len=min_silence_len,
         silence_thresh=silence_thresh,
-        keep_silence=keep_silence
+        keep_silence=keep_silence,
+        seek_step=seek_step
     )
     
     # Prepare output directory
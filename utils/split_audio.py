@@ -1,7 +1,17 @@
 import whisper
 import os
+from bisect import bisect_right
+import numpy as np
 from pydub import AudioSegment
 
+try:
+    from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+WHISPER_SAMPLE_RATE = 16000
+
 def amplify_audio(input_file, output_file, gain_dB=10):
     """
     Amplify the audio by a specified gain (in dB) and save it to a new file.
@@ -30,9 +40,6 @@ def split_audio_into_chunks(audio_path, max_words_per_chunk=20):
     amplified_audio_path = "amplified_" + audio_path
     amplify_audio(audio_path, amplified_audio_path)
 
-    # Initialize Whisper model
-    # model = whisper.load_model("large")  # Or "base" / "small" / "tiny" based on speed/accuracy tradeoff
-
     # Initialize audio file
     audio = AudioSegment.from_wav(amplified_audio_path)
 
@@ -65,36 +72,77 @@ def transcribe_audio_chunk(audio_filename, model):
     result = model.transcribe(audio_filename, language="bn")  # Specify Bengali language ("bn")
     return result["text"]
 
+def load_batched_model(model_size="large-v3", device="auto", compute_type="default"):
+    """
+    Load faster-whisper wrapped in a BatchedInferencePipeline (see transcribe_audio_chunks).
+    """
+    return BatchedInferencePipeline(model=WhisperModel(model_size, device=device, compute_type=compute_type))
+
+def transcribe_audio_chunks(audio_filenames, model, batch_size=16):
+    """
+    Transcribe a list of audio chunks, returning one text per chunk.
+    
+    With a BatchedInferencePipeline the chunks (each up to 30 s) are decoded to 16 kHz,
+    laid end to end and passed as clip_timestamps, so up to batch_size chunks go through
+    the model in one forward pass. Any other model falls back to transcribe_audio_chunk.
+    """
+    if not (FASTER_WHISPER_AVAILABLE and isinstance(model, BatchedInferencePipeline)):
+        return [transcribe_audio_chunk(audio_filename, model) for audio_filename in audio_filenames]
+    
+    if not audio_filenames:
+        return []
+    
+    clips = [decode_audio(audio_filename, sampling_rate=WHISPER_SAMPLE_RATE) for audio_filename in audio_filenames]
+    # The batched pipeline takes clip boundaries as sample offsets; segment times come back in seconds
+    sample_offsets = np.concatenate(([0], np.cumsum([len(clip) for clip in clips]))).tolist()
+    clip_timestamps = [{"start": start, "end": end} for start, end in zip(sample_offsets[:-1], sample_offsets[1:])]
+    offsets = np.asarray(sample_offsets) / WHISPER_SAMPLE_RATE
+    
+    segments, _ = model.transcribe(np.concatenate(clips), language="bn", batch_size=batch_size,
+                                   vad_filter=False, clip_timestamps=clip_timestamps)
+    
+    # Segment times are on the concatenated timeline; map each back to its chunk
+    texts = [[] for _ in audio_filenames]
+    for segment in segments:
+        chunk_index = bisect_right(offsets, (segment.start + segment.end) / 2) - 1
+        texts[min(chunk_index, len(texts) - 1)].append(segment.text.strip())
+    return [" ".join(text) for text in texts]
+
 def slice_transcription(text, max_words_per_chunk=20):
     """
     Split the transcribed text into chunks with a maximum of 20 words per chunk.
     """
-    sentences = text.split(".")
     chunks = []
     
-    for sentence in sentences:
+    for sentence in text.split("."):
         words = sentence.split()
         if len(words) > max_words_per_chunk:
             # Split long sentences into chunks of max_words_per_chunk
-            for i in range(0, len(words), max_words_per_chunk):
-                chunks.append(" ".join(words[i:i+max_words_per_chunk]))
+            chunks.extend(" ".join(words[i:i + max_words_per_chunk])
+                          for i in range(0, len(words), max_words_per_chunk))
         else:
             chunks.append(sentence)
     
     return chunks
 
-# Example of usage:
-audio_path = "denoised_audio/aRHpoSebPPI.wav"  # path to your audio file
-
-# Step 1: Split the audio into chunks
-audio_chunks = split_audio_into_chunks(audio_path)
-
-# Step 2: Transcribe each chunk and split the transcription into 20-word parts
-model = whisper.load_model("large")  # Load Whisper model
-for chunk in audio_chunks:
-    transcription = transcribe_audio_chunk(chunk, model)
-    if transcription:
-        chunks = slice_transcription(transcription)
-        print(f"Transcription for chunk {chunk}:")
-        print(chunks)
-        print("=" * 50)
\ No newline at end of file
+if __name__ == "__main__":
+    # Example of usage:
+    audio_path = "denoised_audio/aRHpoSebPPI.wav"  # path to your audio file
+
+    # Load the Whisper model once and reuse it for every chunk
+    if FASTER_WHISPER_AVAILABLE:
+        model = load_batched_model()
+    else:
+        model = whisper.load_model("large")  # Or "base" / "small" / "tiny" based on speed/accuracy tradeoff
+
+    # Step 1: Split the audio into chunks
+    audio_chunks = split_audio_into_chunks(audio_path)
+
+    # Step 2: Transcribe all chunks and split each transcription into 20-word parts
+    transcriptions = transcribe_audio_chunks(audio_chunks, model)
+    for chunk, transcription in zip(audio_chunks, transcriptions):
+        if transcription:
+            chunks = slice_transcription(transcription)
+            print(f"Transcription for chunk {chunk}:")
+            print(chunks)
+            print("=" * 50)
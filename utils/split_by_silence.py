@@ -1,46 +1,416 @@
+import math
 import os
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 
 import numpy as np
 import noisereduce as nr
-from moviepy.editor import VideoFileClip
-from pydub import AudioSegment, silence
+from pydub import AudioSegment
 
 from .face_detection import filter_chunks_with_faces, save_face_detection_preview
 from .refine_chunks import refine_all_chunks_by_faces, save_refinement_preview
 
+# Optional C/SIMD RMS kernel; falls back to the NumPy reduction when missing
+try:
+    import numpy_rms
+    NUMPY_RMS_AVAILABLE = True
+except ImportError:
+    NUMPY_RMS_AVAILABLE = False
 
-def reduce_noise(audio_seg, noise_duration_ms=500):
-    samples = np.array(audio_seg.get_array_of_samples(), dtype=float)
+# Optional JIT kernel for the frame RMS (numba comes with librosa); multi-threaded
+# over frames and reads the integer samples directly
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _frame_rms_kernel(samples, frame_len):
+        n_frames = samples.size // frame_len
+        out = np.empty(n_frames, np.float32)
+        for i in prange(n_frames):
+            acc = 0.0
+            base = i * frame_len
+            for j in range(frame_len):
+                value = float(samples[base + j])
+                acc += value * value
+            out[i] = np.sqrt(acc / frame_len)
+        return out
+
+# Optional neural voice-activity detector (pip install silero-vad)
+try:
+    from silero_vad import get_speech_timestamps, load_silero_vad
+    SILERO_VAD_AVAILABLE = True
+except ImportError:
+    SILERO_VAD_AVAILABLE = False
+
+# Silero VAD runs on 16 kHz mono audio
+VAD_SAMPLE_RATE = 16000
+
+# Concurrent ffmpeg exports; more than this mostly contends for disk and encoder threads
+EXPORT_WORKERS = min(os.cpu_count() or 1, 4)
+
+# Chunk audio: 16-bit PCM, 16 kHz mono, the format the ASR models consume
+# (no resampling or downmix per chunk downstream, and ~5.5x smaller than 44.1 kHz stereo)
+CHUNK_AUDIO_RATE = 16000
+_WAV_ARGS = ['-acodec', 'pcm_s16le', '-ar', str(CHUNK_AUDIO_RATE), '-ac', '1']
+
+# Re-encode settings for video chunks: fastest x264 preset, frame-accurate cuts
+_X264_ARGS = ['-c:v', 'libx264', '-preset', 'ultrafast', '-crf', '23', '-c:a', 'aac']
+
+# Audio packet size (1 ms of samples) for segmented audio export; the segment
+# muxer can only cut between packets
+_SEGMENT_AUDIO_PACKET = CHUNK_AUDIO_RATE // 1000
+
+# Chunks are cut from one encode of their whole time span when they cover at least
+# this fraction of it; sparser chunks are cut one ffmpeg run at a time
+SEGMENT_EXPORT_MIN_COVERAGE = 0.5
+
+# Noise reduction runs on overlapping windows in parallel processes; windows are
+# crossfaded over the overlap so the joins don't click
+NOISE_REDUCE_WINDOW_S = 30
+NOISE_REDUCE_OVERLAP_S = 0.5
+NOISE_REDUCE_WORKERS = max(1, (os.cpu_count() or 1) // 2)
+
+
+def _segment_samples(audio_seg):
+    # Integer PCM samples of the segment; a zero-copy view of raw_data for the
+    # widths NumPy has a dtype for, instead of copying through array.array
+    if audio_seg.sample_width in (1, 2, 4):
+        return np.frombuffer(audio_seg.raw_data, dtype=f'<i{audio_seg.sample_width}')
+    return np.array(audio_seg.get_array_of_samples())
+
+@lru_cache(maxsize=1)
+def _cuda_available():
+    # torch is heavy to import, so only look for a GPU once noise reduction is requested
+    try:
+        import torch
+    except ImportError:
+        return False
+    return torch.cuda.is_available()
+
+def _reduce_noise_window(window, noise_sample, sr):
+    return nr.reduce_noise(y=window, y_noise=noise_sample, sr=sr)
+
+def reduce_noise(audio_seg, noise_duration_ms=500, workers=NOISE_REDUCE_WORKERS):
+    pcm = _segment_samples(audio_seg)
+    samples = pcm.astype(np.float32)  # noisereduce works in float32; half the memory of float64
     sr = audio_seg.frame_rate
     noise_sample = samples[:int(sr * (noise_duration_ms / 1000))]
-    reduced = nr.reduce_noise(y=samples, y_noise=noise_sample, sr=sr)
+    
+    window = int(sr * NOISE_REDUCE_WINDOW_S) * audio_seg.channels
+    overlap = int(sr * NOISE_REDUCE_OVERLAP_S) * audio_seg.channels
+    if _cuda_available():
+        # noisereduce's torch backend does the STFTs on the GPU in one call
+        reduced = nr.reduce_noise(y=samples, y_noise=noise_sample, sr=sr, use_torch=True, device='cuda')
+    elif workers <= 1 or len(samples) <= window:
+        reduced = nr.reduce_noise(y=samples, y_noise=noise_sample, sr=sr)
+    else:
+        # Every window after the first starts `overlap` samples before the previous one ends
+        starts = range(0, len(samples) - overlap, window - overlap)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = pool.map(_reduce_noise_window, (samples[start:start + window] for start in starts),
+                             repeat(noise_sample), repeat(sr))
+            reduced = np.empty_like(samples)
+            fade_in = np.linspace(0.0, 1.0, overlap, dtype=np.float32)
+            for start, part in zip(starts, parts):
+                if start:
+                    blend = slice(start, start + overlap)
+                    reduced[blend] = reduced[blend] * (1.0 - fade_in) + part[:overlap] * fade_in
+                    reduced[start + overlap:start + len(part)] = part[overlap:]
+                else:
+                    reduced[:len(part)] = part
+    # Clip in place, then a single cast back to the integer sample type
+    np.clip(reduced, np.iinfo(pcm.dtype).min, np.iinfo(pcm.dtype).max, out=reduced)
     return AudioSegment(
-        reduced.astype(np.int16).tobytes(),
+        reduced.astype(pcm.dtype).tobytes(),
         frame_rate=sr,
         sample_width=audio_seg.sample_width,
         channels=audio_seg.channels,
     )
 
-def dynamic_silence_thresh(audio_seg, percentile=5, frame_ms=20):
-    samples = np.array(audio_seg.get_array_of_samples())
-    samples = samples.astype(float)
-    frame_len = int(audio_seg.frame_rate * frame_ms / 1000)
-    rms_values = [
-        np.sqrt(np.mean(samples[i:i+frame_len] ** 2))
-        for i in range(0, len(samples), frame_len)
-    ]
-    non_zero_rms = [v for v in rms_values if v > 0]
-    if not non_zero_rms:
+def _frame_length(audio_seg, frame_ms):
+    # Interleaved samples per frame_ms frame (every channel of each sample period)
+    return max(1, int(audio_seg.frame_rate * frame_ms / 1000)) * audio_seg.channels
+
+def frame_rms(audio_seg, frame_ms=20):
+    """
+    Compute the RMS of every frame_ms frame of the segment in one vectorized pass.
+    
+    Args:
+        audio_seg: AudioSegment to analyze
+        frame_ms: Frame length in milliseconds
+    
+    Returns:
+        float32 array of per-frame RMS values (the last frame may be partial)
+    """
+    samples = _segment_samples(audio_seg)
+    frame_len = _frame_length(audio_seg, frame_ms)
+    
+    # Per-frame RMS in one pass: whole frames as rows of a 2D view, plus the
+    # trailing partial frame (if any) so the values match the frame-by-frame loop
+    full_len = len(samples) // frame_len * frame_len
+    if NUMBA_AVAILABLE:
+        rms_values = _frame_rms_kernel(samples[:full_len], frame_len)
+    elif NUMPY_RMS_AVAILABLE and audio_seg.channels == 1:
+        # SIMD kernel (mono only: interleaved stereo is not accelerated there)
+        rms_values = numpy_rms.rms(samples[:full_len].astype(np.float32), window_size=frame_len)
+    else:
+        # einsum casts the integer samples block by block while accumulating, so
+        # no float copy of the whole buffer is materialized
+        frames = samples[:full_len].reshape(-1, frame_len)
+        energy = np.einsum('ij,ij->i', frames, frames, dtype=np.float64, casting='unsafe')
+        rms_values = np.sqrt(energy / frame_len).astype(np.float32)
+    if full_len < len(samples):
+        tail = samples[full_len:]
+        tail_rms = np.sqrt(np.einsum('i,i->', tail, tail, dtype=np.float64, casting='unsafe') / len(tail))
+        rms_values = np.append(rms_values, np.float32(tail_rms))
+    return rms_values
+
+def dynamic_silence_thresh(audio_seg, percentile=5, frame_ms=20, rms_values=None):
+    if rms_values is None:
+        rms_values = frame_rms(audio_seg, frame_ms)
+    
+    non_zero_rms = rms_values[rms_values > 0]
+    if len(non_zero_rms) == 0:
         return audio_seg.dBFS - 16
     
     # Convert RMS to dBFS manually since AudioSegment.rms_to_dBFS doesn't exist
-    rms_percentile = np.percentile(non_zero_rms, percentile)
+    # 'lower' picks an actual frame's RMS (a selection, no interpolation between frames)
+    rms_percentile = float(np.percentile(non_zero_rms, percentile, method='lower'))
     # Convert RMS to dBFS: 20 * log10(rms / max_possible_value)
     # For 16-bit audio, max value is 32768
     max_value = 1 << (audio_seg.sample_width * 8 - 1)
-    est_thresh_dbfs = 20 * np.log10(rms_percentile / max_value)
+    est_thresh_dbfs = 20 * math.log10(rms_percentile / max_value)
     return est_thresh_dbfs
 
+def detect_silence_frames(audio_seg, rms_values, silence_thresh, min_silence_len, frame_ms=20):
+    """
+    Find silent ranges from per-frame RMS values (see frame_rms), so the RMS pass
+    used for the dynamic threshold also drives the silence split.
+    
+    Boundaries are frame_ms granular; a frame is silent when its RMS is at or
+    below silence_thresh, and a run of silent frames counts once it lasts at
+    least min_silence_len.
+    
+    Args:
+        audio_seg: AudioSegment the RMS values were computed from
+        rms_values: Per-frame RMS values from frame_rms(audio_seg, frame_ms)
+        silence_thresh: Silence threshold in dBFS
+        min_silence_len: Minimum silence length in milliseconds
+        frame_ms: Frame length the RMS values were computed with
+    
+    Returns:
+        List of [start_ms, end_ms] silent ranges
+    """
+    max_value = 1 << (audio_seg.sample_width * 8 - 1)
+    threshold = 10 ** (silence_thresh / 20) * max_value
+    
+    # Run-length encode the silent frames: rising/falling edges of the padded mask
+    silent = np.concatenate(([False], rms_values <= threshold, [False]))
+    edges = np.flatnonzero(np.diff(silent.astype(np.int8)))
+    
+    ms_per_frame = _frame_length(audio_seg, frame_ms) / audio_seg.channels * 1000 / audio_seg.frame_rate
+    length = len(audio_seg)
+    run_starts = np.round(edges[0::2] * ms_per_frame).astype(np.int64)
+    run_ends = np.minimum(np.round(edges[1::2] * ms_per_frame).astype(np.int64), length)
+    keep = run_ends - run_starts >= min_silence_len
+    return np.column_stack((run_starts[keep], run_ends[keep])).tolist()
+
+@lru_cache(maxsize=1)
+def _get_vad_model():
+    return load_silero_vad()
+
+def detect_speech_vad(audio_seg, min_silence_len, keep_silence):
+    """
+    Find speech ranges with the Silero VAD model instead of an energy threshold.
+    
+    Args:
+        audio_seg: AudioSegment to analyze (resampled to 16 kHz mono for the model)
+        min_silence_len: Minimum pause in milliseconds that separates two speech ranges
+        keep_silence: Padding in milliseconds kept around each speech range
+    
+    Returns:
+        List of (start_ms, end_ms) speech ranges
+    """
+    mono = audio_seg.set_channels(1).set_frame_rate(VAD_SAMPLE_RATE)
+    samples = _segment_samples(mono).astype(np.float32) / (1 << (mono.sample_width * 8 - 1))
+    speech = get_speech_timestamps(
+        samples, _get_vad_model(),
+        sampling_rate=VAD_SAMPLE_RATE,
+        min_silence_duration_ms=min_silence_len,
+        speech_pad_ms=keep_silence
+    )
+    return [(segment['start'] * 1000 // VAD_SAMPLE_RATE, segment['end'] * 1000 // VAD_SAMPLE_RATE)
+            for segment in speech]
+
+def silent_chunk_mask(audio_seg, chunks, silent_chunk_dbfs=-60):
+    """
+    Flag chunks whose peak sample stays below silent_chunk_dbfs.
+    
+    Args:
+        audio_seg: AudioSegment the chunk ranges refer to
+        chunks: List of (start_ms, end_ms) ranges
+        silent_chunk_dbfs: Peak level in dBFS at or below which a chunk counts as silent
+    
+    Returns:
+        List of booleans, True for chunks that are silent
+    """
+    samples = _segment_samples(audio_seg)
+    samples_per_ms = audio_seg.frame_rate * audio_seg.channels / 1000
+    max_peak = (1 << (audio_seg.sample_width * 8 - 1)) * 10 ** (silent_chunk_dbfs / 20)
+    
+    # One max/min pass over each chunk's samples (a view, no copy); taking the
+    # negated min instead of np.abs avoids the overflow of abs(-32768) in int16
+    mask = []
+    for chunk_start, chunk_end in chunks:
+        chunk = samples[int(chunk_start * samples_per_ms):int(chunk_end * samples_per_ms)]
+        peak = max(int(chunk.max()), -int(chunk.min())) if len(chunk) else 0
+        mask.append(peak <= max_peak)
+    return mask
+
+def nonsilent_chunk_ranges(silent_ranges, length, keep_silence):
+    """
+    Turn silent ranges into chunk ranges the way pydub's split_on_silence does:
+    invert to non-silent ranges, pad each side with keep_silence and split any
+    overlap between neighbours down the middle.
+    
+    Args:
+        silent_ranges: Sorted [start_ms, end_ms] silent ranges
+        length: Audio length in milliseconds
+        keep_silence: Silence padding to keep around each chunk (ms)
+    
+    Returns:
+        List of (start_ms, end_ms) chunk ranges
+    """
+    if not silent_ranges:
+        nonsilent_ranges = [[0, length]]
+    elif silent_ranges[0] == [0, length]:
+        nonsilent_ranges = []
+    else:
+        nonsilent_ranges = []
+        prev_end = 0
+        for start, end in silent_ranges:
+            nonsilent_ranges.append([prev_end, start])
+            prev_end = end
+        if prev_end != length:
+            nonsilent_ranges.append([prev_end, length])
+        if nonsilent_ranges[0] == [0, 0]:
+            nonsilent_ranges.pop(0)
+    
+    output_ranges = [[start - keep_silence, end + keep_silence] for start, end in nonsilent_ranges]
+    for current, following in zip(output_ranges, output_ranges[1:]):
+        if following[0] < current[1]:
+            current[1] = (current[1] + following[0]) // 2
+            following[0] = current[1]
+    
+    return [(max(start, 0), min(end, length)) for start, end in output_ranges]
+
+def export_video_chunk(video_path, start, end, output_path, stream_copy=False, audio_path=None):
+    """
+    Cut one chunk out of the source video with ffmpeg.
+    
+    By default the chunk is re-encoded with the fastest x264 preset, which keeps
+    the cut frame-accurate (aligned with the exported audio). With stream_copy
+    the streams are only remuxed, which is much faster but starts the chunk at
+    the nearest preceding keyframe.
+    
+    Args:
+        video_path: Source video file
+        start: Chunk start in seconds
+        end: Chunk end in seconds
+        output_path: Output .mp4 path
+        stream_copy: Remux without re-encoding (keyframe-accurate only)
+        audio_path: Optional .wav path; the chunk's audio is written there from the
+            same ffmpeg run (decoded, so sample-accurate even with stream_copy)
+    """
+    if stream_copy:
+        codec_args = ['-c', 'copy', '-avoid_negative_ts', 'make_zero']
+    else:
+        codec_args = _X264_ARGS
+    
+    # -t before -i limits the input, so it applies to both outputs
+    ffmpeg_video_cmd = [
+        'ffmpeg', '-y',
+        '-ss', str(start),
+        '-t', str(end - start),
+        '-i', video_path,
+        *codec_args,
+        output_path
+    ]
+    if audio_path:
+        ffmpeg_video_cmd += ['-map', '0:a', *_WAV_ARGS, audio_path]
+    subprocess.run(ffmpeg_video_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def export_video_segments(video_path, timestamps, video_dir, audio_dir=None):
+    """
+    Cut all chunks from a single ffmpeg encode with the segment muxer.
+    
+    The span from the first chunk start to the last chunk end is encoded once,
+    with keyframes forced at every chunk boundary so each cut is frame-accurate;
+    the segment muxer then starts a new file at each boundary. With audio_dir,
+    the same run also writes each chunk's wav through a second segment muxer
+    (audio packets of 1 ms, so cuts land within a millisecond of the boundary).
+    Segments that fall in gaps between chunks are discarded. Chunks that don't
+    map to exactly one segment (overlapping chunks) are exported with
+    export_video_chunk.
+    
+    Args:
+        video_path: Source video file
+        timestamps: List of (start, end) chunk times in seconds
+        video_dir: Directory for chunk_XXX.mp4 files
+        audio_dir: Optional directory for chunk_XXX.wav files (16-bit PCM, 16 kHz mono)
+    """
+    boundaries = sorted({time for chunk in timestamps for time in chunk})
+    origin = boundaries[0]
+    cut_times = ','.join(f'{time - origin:.3f}' for time in boundaries[1:-1])
+    boundary_index = {time: k for k, time in enumerate(boundaries)}
+    
+    with tempfile.TemporaryDirectory(dir=video_dir) as segment_dir:
+        # -t before -i limits the input, so it applies to both segment muxers
+        ffmpeg_video_cmd = [
+            'ffmpeg', '-y',
+            '-ss', str(origin),
+            '-t', str(boundaries[-1] - origin),
+            '-i', video_path,
+            *_X264_ARGS,
+            '-force_key_frames', cut_times,
+            '-f', 'segment',
+            '-segment_times', cut_times,
+            '-reset_timestamps', '1',
+            os.path.join(segment_dir, 'segment_%05d.mp4')
+        ]
+        if audio_dir:
+            ffmpeg_video_cmd += [
+                '-map', '0:a',
+                '-af', f'aresample={CHUNK_AUDIO_RATE},asetnsamples=n={_SEGMENT_AUDIO_PACKET}:p=0',
+                *_WAV_ARGS,
+                '-f', 'segment',
+                '-segment_times', cut_times,
+                '-reset_timestamps', '1',
+                os.path.join(segment_dir, 'segment_%05d.wav')
+            ]
+        if cut_times:
+            subprocess.run(ffmpeg_video_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        
+        for i, (start, end) in enumerate(timestamps):
+            output_path = os.path.join(video_dir, f"chunk_{i:03d}.mp4")
+            audio_path = os.path.join(audio_dir, f"chunk_{i:03d}.wav") if audio_dir else None
+            segment = boundary_index[start]
+            segment_path = os.path.join(segment_dir, f'segment_{segment:05d}')
+            outputs = [segment_path + '.mp4'] + ([segment_path + '.wav'] if audio_dir else [])
+            if boundary_index[end] == segment + 1 and all(os.path.exists(path) for path in outputs):
+                os.replace(segment_path + '.mp4', output_path)
+                if audio_dir:
+                    os.replace(segment_path + '.wav', audio_path)
+            else:
+                export_video_chunk(video_path, start, end, output_path, audio_path=audio_path)
+
 def merge_close_chunks(timestamps, min_gap=0.25):
     if not timestamps:
         return []
@@ -131,7 +501,8 @@ def split_into_chunks(video_path, audio_path, output_dir,
                       filter_faces=True,
                       face_threshold=0.3, sample_interval=0.5, refine_chunks=True,
                       refine_sample_rate=0.03, min_face_duration=0.5, min_chunk_duration=1.0,
-                      max_face_gap=0.1, apply_noise_reduction=False):
+                      max_face_gap=0.1, apply_noise_reduction=False, stream_copy_video=False,
+                      use_vad=False, silent_chunk_dbfs=-60, use_gpu_decode=True):
     # Get preset parameters
     preset_params = get_silence_preset(silence_preset)
     
@@ -170,65 +541,83 @@ def split_into_chunks(video_path, audio_path, output_dir,
     # Load and preprocess audio
     print("Loading audio...")
     audio_seg = AudioSegment.from_wav(audio_path)
+    audio_len = len(audio_seg)
+    
+    if use_vad and not SILERO_VAD_AVAILABLE:
+        print("⚠️ Silero VAD not installed (pip install silero-vad), falling back to silence detection")
+        use_vad = False
     
-    if apply_noise_reduction:
-        print("Applying noise reduction...")
-        audio_seg = reduce_noise(audio_seg)
+    if use_vad:
+        # Speech ranges straight from the VAD model; no noise reduction or thresholds
+        print("Detecting speech with Silero VAD...")
+        raw_chunks = detect_speech_vad(audio_seg, final_min_silence_len, final_keep_silence)
+        print(f"Found {len(raw_chunks)} raw chunks from voice activity detection")
     else:
-        print("Noise reduction disabled")
+        if apply_noise_reduction:
+            print("Applying noise reduction...")
+            audio_seg = reduce_noise(audio_seg)
+        else:
+            print("Noise reduction disabled")
 
-    print("Estimating silence threshold...")
-    dynamic_thresh = dynamic_silence_thresh(audio_seg)
+        print("Estimating silence threshold...")
+        # One RMS pass feeds both the dynamic threshold and the silence split below
+        rms_values = frame_rms(audio_seg)
+        dynamic_thresh = dynamic_silence_thresh(audio_seg, rms_values=rms_values)
+        audio_dbfs = audio_seg.dBFS  # full-buffer RMS pass; computed once and reused below
     
-    # Calculate silence threshold based on preset and custom override
-    if custom_silence_thresh is not None:
-        # Use custom absolute threshold
-        silence_thresh = custom_silence_thresh
-        print(f"Using custom silence threshold: {silence_thresh:.2f} dBFS")
-    else:
-        # Use preset offset from audio level
-        silence_thresh = max(dynamic_thresh, audio_seg.dBFS + silence_offset)
-        print(f"Using preset-based threshold: {silence_thresh:.2f} dBFS (offset: {silence_offset} dB)")
-    
-    print(f"   Dynamic threshold: {dynamic_thresh:.2f} dBFS")
-    print(f"   Audio dBFS: {audio_seg.dBFS:.2f} dBFS")
-    print(f"   Final threshold: {silence_thresh:.2f} dBFS")
-
-    # Split audio using final parameters
-    raw_chunks = silence.split_on_silence(
-        audio_seg,
-        min_silence_len=final_min_silence_len,
-        silence_thresh=silence_thresh,
-        keep_silence=final_keep_silence
-    )
+        # Calculate silence threshold based on preset and custom override
+        if custom_silence_thresh is not None:
+            # Use custom absolute threshold
+            silence_thresh = custom_silence_thresh
+            print(f"Using custom silence threshold: {silence_thresh:.2f} dBFS")
+        else:
+            # Use preset offset from audio level
+            silence_thresh = max(dynamic_thresh, audio_dbfs + silence_offset)
+            print(f"Using preset-based threshold: {silence_thresh:.2f} dBFS (offset: {silence_offset} dB)")
+    
+        print(f"   Dynamic threshold: {dynamic_thresh:.2f} dBFS")
+        print(f"   Audio dBFS: {audio_dbfs:.2f} dBFS")
+        print(f"   Final threshold: {silence_thresh:.2f} dBFS")
+
+        # Split audio using final parameters (chunks are (start_ms, end_ms) ranges;
+        # no audio is sliced)
+        silent_ranges = detect_silence_frames(audio_seg, rms_values, silence_thresh, final_min_silence_len)
+        raw_chunks = nonsilent_chunk_ranges(silent_ranges, audio_len, final_keep_silence)
 
-    print(f"Found {len(raw_chunks)} raw chunks from silence detection")
+        print(f"Found {len(raw_chunks)} raw chunks from silence detection")
     
     # If no chunks found (no silence detected), force split by max length
     if len(raw_chunks) <= 1:
         print("No silence detected, forcing split by max chunk length...")
         raw_chunks = []
-        for i in range(0, len(audio_seg), final_max_chunk_len):
-            raw_chunks.append(audio_seg[i:i + final_max_chunk_len])
+        for i in range(0, audio_len, final_max_chunk_len):
+            raw_chunks.append((i, min(i + final_max_chunk_len, audio_len)))
 
     # Enforce max length per chunk
     final_chunks = []
-    for chunk in raw_chunks:
-        if len(chunk) <= final_max_chunk_len:
-            final_chunks.append(chunk)
+    for chunk_start, chunk_end in raw_chunks:
+        if chunk_end - chunk_start <= final_max_chunk_len:
+            final_chunks.append((chunk_start, chunk_end))
         else:
-            for i in range(0, len(chunk), final_max_chunk_len):
-                final_chunks.append(chunk[i:i + final_max_chunk_len])
+            for i in range(chunk_start, chunk_end, final_max_chunk_len):
+                final_chunks.append((i, min(i + final_max_chunk_len, chunk_end)))
 
     # Generate timestamps
     timestamps = []
     cursor = 0
-    for chunk in final_chunks:
+    for chunk_start, chunk_end in final_chunks:
         start = cursor
-        end = start + len(chunk)
+        end = start + (chunk_end - chunk_start)
         timestamps.append((start / 1000, end / 1000))  # seconds
         cursor = end
 
+    # Drop chunks that are silent throughout before the face detection and
+    # exports spend any time on them (their span still advances the cursor above)
+    if silent_chunk_dbfs is not None:
+        silent = silent_chunk_mask(audio_seg, final_chunks, silent_chunk_dbfs)
+        timestamps = [ts for ts, is_silent in zip(timestamps, silent) if not is_silent]
+        print(f"Dropped {sum(silent)} silent chunks (peak <= {silent_chunk_dbfs} dBFS)")
+
     # Keep chunks small - disable merging for sentence-level granularity
     print("Keeping chunks small for sentence-level processing...")
     print(f"Total chunks before face filtering: {len(timestamps)}")
@@ -239,7 +628,8 @@ def split_into_chunks(video_path, audio_path, output_dir,
         timestamps = filter_chunks_with_faces(
             video_path, timestamps, 
             sample_interval=sample_interval,
-            face_threshold=face_threshold
+            face_threshold=face_threshold,
+            use_gpu_decode=use_gpu_decode
         )
         
         # Save face detection previews
@@ -253,7 +643,8 @@ def split_into_chunks(video_path, audio_path, output_dir,
             sample_rate=refine_sample_rate,
             min_face_duration=min_face_duration,
             min_chunk_duration=min_chunk_duration,
-            max_gap=max_face_gap
+            max_gap=max_face_gap,
+            use_gpu_decode=use_gpu_decode
         )
         
         # Save refinement previews
@@ -281,38 +672,29 @@ def split_into_chunks(video_path, audio_path, output_dir,
         print("⚠️ No chunks remaining after face filtering!")
         return []
 
-    # Export audio and video
-    import subprocess
-    video = VideoFileClip(video_path)
-    for i, (start, end) in enumerate(timestamps):
-        print(f"Saving chunk {i:03d} [{start:.2f}s - {end:.2f}s]...")
-        
-        # Extract audio directly from original video using ffmpeg (lossless)
-        audio_output = os.path.join(audio_out, f"chunk_{i:03d}.wav")
-        duration = end - start
-        
-        # Use ffmpeg to extract audio without re-encoding quality loss
-        ffmpeg_audio_cmd = [
-            'ffmpeg', '-y',
-            '-ss', str(start),
-            '-i', video_path,
-            '-t', str(duration),
-            '-vn',  # No video
-            '-acodec', 'pcm_s16le',  # High quality PCM audio
-            '-ar', '44100',  # Sample rate
-            '-ac', '2',  # Stereo
-            audio_output
-        ]
-        subprocess.run(ffmpeg_audio_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    # Export audio and video. Every export is an independent ffmpeg process, so
+    # they run side by side; chunk_XXX names keep the original order
+    with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as pool:
+        # Dense re-encoded chunks come from one encode of their span (one encoder
+        # startup and decode pass); otherwise each chunk is its own ffmpeg run
+        span = max(end for _, end in timestamps) - min(start for start, _ in timestamps)
+        covered = sum(end - start for start, end in timestamps)
+        if not stream_copy_video and len(timestamps) > 1 and covered >= SEGMENT_EXPORT_MIN_COVERAGE * span:
+            # Video and 16 kHz mono audio of every chunk from one demux of the source
+            print(f"Saving audio and video for {len(timestamps)} chunks from a single segmented encode...")
+            jobs = [pool.submit(export_video_segments, video_path, timestamps, video_out, audio_dir=audio_out)]
+        else:
+            # Each run seeks to its chunk and writes the video and the 16 kHz mono
+            # audio together, so the source is demuxed once per chunk
+            jobs = []
+            for i, (start, end) in enumerate(timestamps):
+                print(f"Saving chunk {i:03d} [{start:.2f}s - {end:.2f}s]...")
+                jobs.append(pool.submit(export_video_chunk, video_path, start, end,
+                                        os.path.join(video_out, f"chunk_{i:03d}.mp4"),
+                                        stream_copy=stream_copy_video,
+                                        audio_path=os.path.join(audio_out, f"chunk_{i:03d}.wav")))
         
-        # Extract video chunk
-        subclip = video.subclip(start, end)
-        subclip.write_videofile(
-            os.path.join(video_out, f"chunk_{i:03d}.mp4"),
-            codec="libx264",
-            audio_codec="aac",
-            verbose=False,
-            logger=None
-        )
+        for job in jobs:
+            job.result()
 
     return timestamps
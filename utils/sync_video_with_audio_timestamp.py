@@ -1,17 +1,36 @@
-from pydub import AudioSegment
 import moviepy.editor as mp
 import os
+import struct
+
+def wav_length_ms(path):
+    # Duration from the RIFF header alone (same value as len(AudioSegment.from_wav(path))).
+    # Walk the chunks instead of assuming a 44-byte header: ffmpeg adds a LIST chunk
+    with open(path, 'rb') as f:
+        riff, _, wave_id = struct.unpack('<4sI4s', f.read(12))
+        if riff != b'RIFF' or wave_id != b'WAVE':
+            raise ValueError(f"Not a WAV file: {path}")
+        block_align = frame_rate = None
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                raise ValueError(f"No data chunk in WAV file: {path}")
+            chunk_id, chunk_size = struct.unpack('<4sI', header)
+            if chunk_id == b'fmt ':
+                _, _, frame_rate, _, block_align = struct.unpack('<HHIIH', f.read(14))
+                f.seek(chunk_size - 14 + (chunk_size & 1), os.SEEK_CUR)
+            elif chunk_id == b'data':
+                return round(1000 * (chunk_size // block_align) / frame_rate)
+            else:
+                f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
 
 def get_chunk_timestamps(full_audio_path, chunks_dir):
     # full_audio = AudioSegment.from_wav(full_audio_path)
-    chunk_files = sorted(f for f in os.listdir(chunks_dir) if f.endswith('.wav'))
+    chunk_files = sorted(entry.name for entry in os.scandir(chunks_dir) if entry.name.endswith('.wav'))
     timestamps = []
     cursor = 0
 
     for chunk_file in chunk_files:
-        chunk_path = os.path.join(chunks_dir, chunk_file)
-        chunk = AudioSegment.from_wav(chunk_path)
-        chunk_length = len(chunk)
+        chunk_length = wav_length_ms(os.path.join(chunks_dir, chunk_file))
 
         start_time = cursor
         end_time = cursor + chunk_length
@@ -4,7 +4,10 @@ import librosa
 
 # Load the pre-trained Whisper model and processor
 processor = WhisperProcessor.from_pretrained("bangla-speech-processing/BanglaASR")
-model = WhisperForConditionalGeneration.from_pretrained("bangla-speech-processing/BanglaASR")
+# Half precision on the GPU when there is one; the CPU keeps float32
+device = "cuda" if torch.cuda.is_available() else "cpu"
+dtype = torch.float16 if device == "cuda" else torch.float32
+model = WhisperForConditionalGeneration.from_pretrained("bangla-speech-processing/BanglaASR", torch_dtype=dtype).to(device)
 
 # Load the audio file
 audio_path = 'downloads/aRHpoSebPPI_audio.wav'  # Ensure the path to the audio file is correct
@@ -17,9 +20,9 @@ inputs = processor(audio, return_tensors="pt", sampling_rate=16000)
 print(f"Processed inputs: {inputs}")
 
 # Generate transcription with the Whisper model
-with torch.no_grad():
+with torch.inference_mode():
     # Use the correct input features for generation
-    predicted_ids = model.generate(inputs["input_features"])  # Pass input_features
+    predicted_ids = model.generate(inputs["input_features"].to(device, dtype))  # Pass input_features
     transcription = processor.batch_decode(predicted_ids, skip_special_tokens=True)
 
 # Print the transcription
@@ -1,19 +1,36 @@
 import os
+from functools import lru_cache
 from banglaspeech2text import Speech2Text
 from tqdm import tqdm
 
-def transcribe_chunks(chunks_dir, show_progress=False):
+@lru_cache(maxsize=None)
+def _get_asr(model="large"):
+    # Loading the weights dominates short runs; keep one instance per process so
+    # every video in a batch reuses it instead of reloading it per call
+    return Speech2Text(model=model)
+
+def transcribe_chunks(chunks_dir, show_progress=False, overwrite=False):
     audio_dir = os.path.join(chunks_dir, "audio")
     text_dir = os.path.join(chunks_dir, "text")
     os.makedirs(text_dir, exist_ok=True)
 
-    files = sorted([f for f in os.listdir(audio_dir) if f.endswith(".wav")])
-    asr = Speech2Text(model="large")
+    files = sorted(entry.name for entry in os.scandir(audio_dir) if entry.name.endswith(".wav"))
+
+    # Skip already transcribed chunks so a partial run resumes where it stopped,
+    # unless a forced re-transcription asks to overwrite them
+    jobs = []
+    for file in files:
+        text_file = os.path.join(text_dir, file.replace(".wav", ".txt"))
+        if overwrite or not os.path.exists(text_file):
+            jobs.append((os.path.join(audio_dir, file), text_file))
+    if not jobs:
+        return
+
+    asr = _get_asr()
 
-    iterator = tqdm(files, desc="Transcribing chunks", unit="chunk") if show_progress else files
+    iterator = tqdm(jobs, desc="Transcribing chunks", unit="chunk") if show_progress else jobs
 
-    for file in iterator:
-        path = os.path.join(audio_dir, file)
+    for path, text_file in iterator:
         text = asr.recognize(path)
-        with open(os.path.join(text_dir, file.replace(".wav", ".txt")), "w", encoding="utf-8") as f:
-            f.write(text)
\ No newline at end of file
+        with open(text_file, "w", encoding="utf-8") as f:
+            f.write(text)
@@ -1,10 +1,23 @@
 # utils/transcribe_chunks_google.py
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import speech_recognition as sr
 from pydub import AudioSegment, effects
 from tqdm import tqdm
 
+# Concurrent Google STT requests; each worker spends most of its time waiting on the network
+STT_WORKERS = int(os.environ.get("STT_WORKERS", "16"))
+
+# Recognizer objects keep per-request state, so every worker thread gets its own
+_thread_local = threading.local()
+
+def _get_recognizer():
+    if not hasattr(_thread_local, "recognizer"):
+        _thread_local.recognizer = sr.Recognizer()
+    return _thread_local.recognizer
+
 def preprocess_audio(path, max_duration=10_000):
     audio = AudioSegment.from_wav(path)
     # Normalize audio
@@ -14,43 +27,44 @@ def preprocess_audio(path, max_duration=10_000):
         audio = audio[:max_duration]
     return audio
 
-def transcribe_chunks_google(chunks_dir, show_progress=False):
+def _transcribe_chunk(audio_path, text_file):
+    # Hand the normalized, trimmed PCM to the recognizer in memory (mono, as
+    # sr.AudioFile would produce) instead of round-tripping it through a temp WAV
+    processed = preprocess_audio(audio_path).set_channels(1)
+    audio = sr.AudioData(processed.raw_data, processed.frame_rate, processed.sample_width)
+
+    recognizer = _get_recognizer()
+    try:
+        result = recognizer.recognize_google(audio, language="bn-BD")
+        with open(text_file, "w", encoding="utf-8") as f:
+            f.write(result)
+    except sr.UnknownValueError:
+        with open(text_file, "w", encoding="utf-8") as f:
+            f.write("[Unrecognized Speech]")
+    except sr.RequestError as e:
+        with open(text_file, "w", encoding="utf-8") as f:
+            f.write(f"[API Error: {e}]")
+
+def transcribe_chunks_google(chunks_dir, show_progress=False, max_workers=STT_WORKERS, overwrite=False):
     audio_dir = os.path.join(chunks_dir, "audio")
     text_dir = os.path.join(chunks_dir, "text_google")
     os.makedirs(text_dir, exist_ok=True)
 
-    files = sorted([f for f in os.listdir(audio_dir) if f.endswith(".wav")])
-    recognizer = sr.Recognizer()
-
-    iterator = tqdm(files, desc="Transcribing (Google)", unit="chunk") if show_progress else files
-
-    for file in iterator:
-        audio_path = os.path.join(audio_dir, file)
-        processed = preprocess_audio(audio_path)
-
-        # Export to a temporary normalized trimmed WAV
-        tmp_path = os.path.join(audio_dir, f"_tmp_{file}")
-        processed.export(tmp_path, format="wav")
+    files = sorted(entry.name for entry in os.scandir(audio_dir) if entry.name.endswith(".wav"))
 
+    # Skip already transcribed chunks before doing any audio work on them,
+    # unless a forced re-transcription asks to overwrite them
+    jobs = []
+    for file in files:
         text_file = os.path.join(text_dir, file.replace(".wav", ".txt"))
+        if overwrite or not os.path.exists(text_file):
+            jobs.append((os.path.join(audio_dir, file), text_file))
 
-        # Skip if already transcribed
-        if os.path.exists(text_file):
-            os.remove(tmp_path)  # Clean up temp file
-            continue
-
-        try:
-            with sr.AudioFile(tmp_path) as source:
-                audio = recognizer.record(source)
-                result = recognizer.recognize_google(audio, language="bn-BD")
-                with open(text_file, "w", encoding="utf-8") as f:
-                    f.write(result)
-        except sr.UnknownValueError:
-            with open(text_file, "w", encoding="utf-8") as f:
-                f.write("[Unrecognized Speech]")
-        except sr.RequestError as e:
-            with open(text_file, "w", encoding="utf-8") as f:
-                f.write(f"[API Error: {e}]")
-
-        # Clean up temp file
-        os.remove(tmp_path)
\ No newline at end of file
+    # Requests are independent, so run them side by side: total time approaches
+    # the slowest request instead of the sum of all of them
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = pool.map(lambda job: _transcribe_chunk(*job), jobs)
+        if show_progress:
+            results = tqdm(results, total=len(jobs), desc="Transcribing (Google)", unit="chunk", mininterval=1.0)
+        for _ in results:
+            pass
@@ -12,77 +12,122 @@ This module provides utilities for managing transcription processes:
 import os
 import time
 import logging
+import importlib
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 
-from .progress_tracking import update_video_progress
-from .file_discovery import check_transcription_status, copy_transcripts_to_outputs, save_transcripts_to_input_folder, save_both_models_transcripts
+from .progress_tracking import set_progress_lock, update_video_progress
+from .file_discovery import check_transcription_status, check_transcription_status_multi, copy_transcripts_to_outputs, save_transcripts_to_input_folder, save_both_models_transcripts
 from .audio_processing import cleanup_temporary_files
 
 logger = logging.getLogger(__name__)
 
+# Batch items prepared (extracted and split into chunks) ahead of the one being transcribed
+PREPARE_PREFETCH = 2
 
-def transcribe_video_both_models(video_info, force_retranscribe=False):
-    """Transcribe a single video using both Google and Whisper models."""
-    from utils.transcribe_chunks import transcribe_chunks  # Whisper
-    from utils.transcribe_chunks_google import transcribe_chunks_google  # Google
+# Chunk transcription backend per model: (module, function, start message). The
+# modules are imported on first use, so each model's dependencies stay optional
+_MODEL_BACKENDS = {
+    "whisper": ("utils.transcribe_chunks", "transcribe_chunks",
+                "🤖 Starting Whisper transcription for %s"),
+    "google": ("utils.transcribe_chunks_google", "transcribe_chunks_google",
+               "🗣️  Starting Google Speech Recognition for %s"),
+}
+
+
+def _transcribe_chunks_with(model, chunks_dir, video_id, overwrite=False):
+    """Transcribe every chunk in chunks_dir with the backend registered for model."""
+    module_name, function_name, start_message = _MODEL_BACKENDS[model]
+    logger.info(start_message, video_id)
+    transcribe = getattr(importlib.import_module(module_name), function_name)
+    transcribe(chunks_dir, show_progress=True, overwrite=overwrite)
+
+
+def _run_model(model, video_info, status, force_retranscribe):
+    """
+    Run one model's transcription for transcribe_video_both_models.
     
+    Returns:
+        Tuple of (success, text_count)
+    """
     video_id = video_info['video_id']
     chunks_dir = video_info['chunks_dir']
-    audio_count = video_info['audio_count']
     
-    logger.info(f"🎯 Processing video: {video_id} ({audio_count} chunks) with BOTH models")
+    logger.info("🔄 Starting %s transcription...", model.upper())
     
-    models = ["google", "whisper"]
-    success_count = 0
+    if status["complete"] and not force_retranscribe:
+        logger.info("✅ %s transcription already complete for %s\n   📊 %d/%d files transcribed",
+                    model.upper(), video_id, status['text_count'], status['audio_count'])
+        update_video_progress(video_id, model, "completed", status['text_count'], status['audio_count'])
+        return True, status['text_count']
     
-    for model in models:
-        logger.info(f"🔄 Starting {model.upper()} transcription...")
-        
-        # Check existing transcription status
-        status = check_transcription_status(chunks_dir, model)
-        
-        if status["complete"] and not force_retranscribe:
-            logger.info(f"✅ {model.upper()} transcription already complete for {video_id}")
-            logger.info(f"   📊 {status['text_count']}/{status['audio_count']} files transcribed")
-            update_video_progress(video_id, model, "completed", status['text_count'], status['audio_count'])
-            success_count += 1
-            continue
-        
-        if status["exists"] and not status["complete"]:
-            logger.info(f"⚠️  Partial {model.upper()} transcription found for {video_id}")
-            logger.info(f"   📊 {status['text_count']}/{status['audio_count']} files completed")
-            logger.info(f"   🔄 Continuing {model.upper()} transcription...")
-            update_video_progress(video_id, model, "partial", status['text_count'], status['audio_count'])
+    if status["exists"] and not status["complete"]:
+        logger.info("⚠️  Partial %s transcription found for %s\n   📊 %d/%d files completed\n"
+                    "   🔄 Continuing %s transcription...",
+                    model.upper(), video_id, status['text_count'], status['audio_count'], model.upper())
+        update_video_progress(video_id, model, "partial", status['text_count'], status['audio_count'])
+    
+    try:
+        start_time = time.time()
         
-        try:
-            start_time = time.time()
+        # Perform transcription
+        _transcribe_chunks_with(model, chunks_dir, video_id, overwrite=force_retranscribe)
             
-            # Perform transcription
-            if model == "whisper":
-                logger.info(f"🤖 Starting Whisper transcription for {video_id}")
-                transcribe_chunks(chunks_dir, show_progress=True)
-            elif model == "google":
-                logger.info(f"🗣️  Starting Google Speech Recognition for {video_id}")
-                transcribe_chunks_google(chunks_dir, show_progress=True)
-                
-            # Verify completion
-            final_status = check_transcription_status(chunks_dir, model)
-            duration = time.time() - start_time
+        # Verify completion
+        final_status = check_transcription_status(chunks_dir, model)
+        duration = time.time() - start_time
+        
+        if final_status["complete"]:
+            logger.info("✅ %s transcription completed for %s in %.1fs\n"
+                        "   📊 %d files transcribed successfully\n   ⚡ Rate: %.1f chunks/second",
+                        model.upper(), video_id, duration,
+                        final_status['text_count'], final_status['text_count'] / duration)
+            update_video_progress(video_id, model, "completed", final_status['text_count'], final_status['audio_count'])
+            return True, final_status['text_count']
+        else:
+            logger.warning("⚠️  %s transcription incomplete for %s\n   📊 %d/%d files completed",
+                           model.upper(), video_id, final_status['text_count'], final_status['audio_count'])
+            update_video_progress(video_id, model, "partial", final_status['text_count'], final_status['audio_count'])
+            return False, final_status['text_count']
             
-            if final_status["complete"]:
-                logger.info(f"✅ {model.upper()} transcription completed for {video_id} in {duration:.1f}s")
-                logger.info(f"   📊 {final_status['text_count']} files transcribed successfully")
-                logger.info(f"   ⚡ Rate: {final_status['text_count']/duration:.1f} chunks/second")
-                update_video_progress(video_id, model, "completed", final_status['text_count'], final_status['audio_count'])
-                success_count += 1
-            else:
-                logger.warning(f"⚠️  {model.upper()} transcription incomplete for {video_id}")
-                logger.warning(f"   📊 {final_status['text_count']}/{final_status['audio_count']} files completed")
-                update_video_progress(video_id, model, "partial", final_status['text_count'], final_status['audio_count'])
-                
-        except Exception as e:
-            logger.error(f"❌ Error transcribing {video_id} with {model.upper()}: {str(e)}")
-            update_video_progress(video_id, model, "failed", 0, audio_count)
+    except Exception as e:
+        logger.error("❌ Error transcribing %s with %s: %s", video_id, model.upper(), e)
+        update_video_progress(video_id, model, "failed", 0, video_info['audio_count'])
+        return False, status['text_count']
+
+
+def transcribe_video_both_models(video_info, force_retranscribe=False):
+    """
+    Transcribe a single video using both Google and Whisper models.
+    
+    The two models run side by side: Google waits on the network while Whisper
+    computes, so a video takes about as long as the slower of the two.
+    
+    Returns:
+        Tuple of (success, google_text_count, whisper_text_count, audio_count); success
+        is True only if both models completed
+    """
+    video_id = video_info['video_id']
+    chunks_dir = video_info['chunks_dir']
+    audio_count = video_info['audio_count']
+    
+    logger.info("🎯 Processing video: %s (%d chunks) with BOTH models", video_id, audio_count)
+    
+    models = ["google", "whisper"]
+    
+    # Check existing transcription status of both models in one pass
+    statuses = check_transcription_status_multi(chunks_dir, models)
+    
+    with ThreadPoolExecutor(max_workers=len(models)) as pool:
+        futures = {model: pool.submit(_run_model, model, video_info, statuses[model], force_retranscribe)
+                   for model in models}
+        results = {model: future.result() for model, future in futures.items()}
+    
+    success_count = sum(success for success, _ in results.values())
+    text_counts = {model: text_count for model, (_, text_count) in results.items()}
     
     # Save results using the both models format if at least one succeeded
     if success_count > 0:
@@ -94,30 +139,34 @@ def transcribe_video_both_models(video_info, force_retranscribe=False):
             # For pre-processed files, also use both models saving
             save_both_models_transcripts(video_info)
         
-        logger.info(f"🎉 Both models processing completed! Successfully transcribed with {success_count}/2 models")
-        return success_count == 2  # Return True only if both models succeeded
+        logger.info("🎉 Both models processing completed! Successfully transcribed with %d/2 models", success_count)
+        # Return True only if both models succeeded
+        return success_count == 2, text_counts["google"], text_counts["whisper"], audio_count
     else:
-        logger.error(f"❌ Both models failed for {video_id}")
-        return False
+        logger.error("❌ Both models failed for %s", video_id)
+        return False, text_counts["google"], text_counts["whisper"], audio_count
 
 
 def transcribe_video(video_info, model, force_retranscribe=False):
-    """Transcribe a single video using the specified model."""
-    from utils.transcribe_chunks import transcribe_chunks  # Whisper
-    from utils.transcribe_chunks_google import transcribe_chunks_google  # Google
+    """
+    Transcribe a single video using the specified model.
     
+    Returns:
+        Tuple of (success, text_count, audio_count) with the transcript count on disk
+        afterwards, so callers don't have to re-check the chunks directory
+    """
     video_id = video_info['video_id']
     chunks_dir = video_info['chunks_dir']
     audio_count = video_info['audio_count']
     
-    logger.info(f"🎯 Processing video: {video_id} ({audio_count} chunks)")
+    logger.info("🎯 Processing video: %s (%d chunks)", video_id, audio_count)
     
     # Check existing transcription status
     status = check_transcription_status(chunks_dir, model)
     
     if status["complete"] and not force_retranscribe:
-        logger.info(f"✅ Transcription already complete for {video_id} using {model}")
-        logger.info(f"   📊 {status['text_count']}/{status['audio_count']} files transcribed")
+        logger.info("✅ Transcription already complete for %s using %s\n   📊 %d/%d files transcribed",
+                    video_id, model, status['text_count'], status['audio_count'])
         update_video_progress(video_id, model, "completed", status['text_count'], status['audio_count'])
         
         # Save to input folder if it's a temporary processing (raw file)
@@ -127,37 +176,32 @@ def transcribe_video(video_info, model, force_retranscribe=False):
         else:
             # For pre-processed files, keep the old behavior
             copy_transcripts_to_outputs(video_info, model)
-        return True
+        return True, status['text_count'], status['audio_count']
     
     if status["exists"] and not status["complete"]:
-        logger.info(f"⚠️  Partial transcription found for {video_id}")
-        logger.info(f"   📊 {status['text_count']}/{status['audio_count']} files completed")
-        logger.info(f"   🔄 Continuing transcription...")
+        logger.info("⚠️  Partial transcription found for %s\n   📊 %d/%d files completed\n"
+                    "   🔄 Continuing transcription...",
+                    video_id, status['text_count'], status['audio_count'])
         update_video_progress(video_id, model, "partial", status['text_count'], status['audio_count'])
     
     try:
         start_time = time.time()
         
         # Perform transcription
-        if model == "whisper":
-            logger.info(f"🤖 Starting Whisper transcription for {video_id}")
-            transcribe_chunks(chunks_dir, show_progress=True)
-        elif model == "google":
-            logger.info(f"🗣️  Starting Google Speech Recognition for {video_id}")
-            transcribe_chunks_google(chunks_dir, show_progress=True)
-        else:
-            logger.error(f"❌ Unknown model: {model}")
+        if model not in _MODEL_BACKENDS:
+            logger.error("❌ Unknown model: %s", model)
             update_video_progress(video_id, model, "failed", 0, audio_count)
-            return False
+            return False, status['text_count'], audio_count
+        _transcribe_chunks_with(model, chunks_dir, video_id, overwrite=force_retranscribe)
             
         # Verify completion
         final_status = check_transcription_status(chunks_dir, model)
         duration = time.time() - start_time
         
         if final_status["complete"]:
-            logger.info(f"✅ Transcription completed for {video_id} in {duration:.1f}s")
-            logger.info(f"   📊 {final_status['text_count']} files transcribed successfully")
-            logger.info(f"   ⚡ Rate: {final_status['text_count']/duration:.1f} chunks/second")
+            logger.info("✅ Transcription completed for %s in %.1fs\n"
+                        "   📊 %d files transcribed successfully\n   ⚡ Rate: %.1f chunks/second",
+                        video_id, duration, final_status['text_count'], final_status['text_count'] / duration)
             update_video_progress(video_id, model, "completed", final_status['text_count'], final_status['audio_count'])
             
             # Save to input folder if it's a temporary processing (raw file)
@@ -167,41 +211,49 @@ def transcribe_video(video_info, model, force_retranscribe=False):
             else:
                 # For pre-processed files, keep the old behavior
                 copy_transcripts_to_outputs(video_info, model)
-            return True
+            return True, final_status['text_count'], final_status['audio_count']
         else:
-            logger.warning(f"⚠️  Transcription incomplete for {video_id}")
-            logger.warning(f"   📊 {final_status['text_count']}/{final_status['audio_count']} files completed")
+            logger.warning("⚠️  Transcription incomplete for %s\n   📊 %d/%d files completed",
+                           video_id, final_status['text_count'], final_status['audio_count'])
             update_video_progress(video_id, model, "partial", final_status['text_count'], final_status['audio_count'])
-            return False
+            return False, final_status['text_count'], final_status['audio_count']
             
     except Exception as e:
-        logger.error(f"❌ Error transcribing {video_id}: {str(e)}")
+        logger.error("❌ Error transcribing %s: %s", video_id, e)
         update_video_progress(video_id, model, "failed", 0, audio_count)
-        return False
+        return False, status['text_count'], audio_count
 
 
 def generate_transcription_report(processable_items, model):
-    """Generate a summary report of transcription status."""
+    """
+    Generate a summary report of transcription status.
+    
+    processable_items can be any iterable (e.g. a generator over a large tree);
+    it is walked once and only running totals are kept.
+    """
     from .progress_tracking import get_session_stats
     
     logger.info("📋 Generating transcription status report...")
     
-    # Separate pre-processed from raw files
-    pre_processed = [item for item in processable_items if not item.get('needs_processing', False)]
-    raw_files = [item for item in processable_items if item.get('needs_processing', False)]
-    
-    total_items = len(processable_items)
+    pre_processed_count = 0
+    raw_count = 0
     completed_videos = 0
     partial_videos = 0
     pending_videos = 0
     total_audio_chunks = 0
     total_transcribed_chunks = 0
     
-    # Analyze pre-processed items
-    for item in pre_processed:
+    # Analyze pre-processed items; raw files count as pending
+    for item in processable_items:
+        if item.get('needs_processing', False):
+            raw_count += 1
+            pending_videos += 1
+            continue
+        
+        pre_processed_count += 1
         if model == "both":
-            google_status = check_transcription_status(item['chunks_dir'], "google")
-            whisper_status = check_transcription_status(item['chunks_dir'], "whisper")
+            statuses = check_transcription_status_multi(item['chunks_dir'], ("google", "whisper"))
+            google_status, whisper_status = statuses["google"], statuses["whisper"]
             total_audio_chunks += google_status['audio_count']
             total_transcribed_chunks += google_status['text_count'] + whisper_status['text_count']
             
@@ -224,9 +276,6 @@ def generate_transcription_report(processable_items, model):
             else:
                 pending_videos += 1
     
-    # Raw files count as pending
-    pending_videos += len(raw_files)
-    
     # Get session statistics
     session_stats = get_session_stats()
     
@@ -234,14 +283,14 @@ def generate_transcription_report(processable_items, model):
     model_display = "BOTH (Google + Whisper)" if model == "both" else model.upper()
     logger.info(f"📊 TRANSCRIPTION REPORT ({model_display} MODEL)")
     logger.info("=" * 60)
-    logger.info(f"📁 Total items found: {total_items}")
-    logger.info(f"   📦 Pre-processed directories: {len(pre_processed)}")
-    logger.info(f"   📄 Raw media files: {len(raw_files)}")
+    logger.info(f"📁 Total items found: {pre_processed_count + raw_count}")
+    logger.info(f"   📦 Pre-processed directories: {pre_processed_count}")
+    logger.info(f"   📄 Raw media files: {raw_count}")
     logger.info(f"✅ Completed videos: {completed_videos}")
     logger.info(f"⚠️  Partial videos: {partial_videos}")
     logger.info(f"⏳ Pending items: {pending_videos}")
     
-    if pre_processed:
+    if pre_processed_count:
         logger.info(f"🎵 Total audio chunks (pre-processed): {total_audio_chunks}")
         logger.info(f"📝 Transcribed chunks: {total_transcribed_chunks}")
         
@@ -266,67 +315,160 @@ def generate_transcription_report(processable_items, model):
     logger.info("=" * 60)
 
 
-def process_batch_items(processable_items, model, force_retranscribe, temp_dir, silence_params):
+def _prepare_item(item_info, temp_dir, silence_params):
+    """Prepare a batch item for transcription, returning its video_info or None on failure."""
+    from .file_discovery import prepare_video_for_transcription
+    
+    try:
+        return prepare_video_for_transcription(item_info, temp_dir, silence_params)
+    except Exception as e:
+        logger.error(f"❌ Error processing {item_info.get('video_id', 'unknown')}: {e}")
+        return None
+
+
+def _transcribe_item(video_info, model, force_retranscribe):
+    """
+    Transcribe a prepared item.
+    
+    Returns:
+        Tuple of (success, chunk_count, transcribed_count)
+    """
+    try:
+        # Transcribe using appropriate function based on model; both return the
+        # transcript counts they end with, so there is no re-scan here
+        if model == "both":
+            # For both models, count the total from both google and whisper
+            success, google_count, whisper_count, _ = transcribe_video_both_models(video_info, force_retranscribe)
+            transcribed = google_count + whisper_count
+        else:
+            success, transcribed, _ = transcribe_video(video_info, model, force_retranscribe)
+    except Exception as e:
+        logger.error(f"❌ Error processing {video_info.get('video_id', 'unknown')}: {e}")
+        return False, video_info['audio_count'], 0
+    
+    return success, video_info['audio_count'], transcribed
+
+
+def _process_one(item_info, model, force_retranscribe, temp_dir, silence_params):
+    """
+    Prepare, transcribe and clean up a single batch item.
+    
+    Returns:
+        Tuple of (success, chunk_count, transcribed_count)
+    """
+    video_info = _prepare_item(item_info, temp_dir, silence_params)
+    if video_info is None:
+        return False, 0, 0
+    try:
+        return _transcribe_item(video_info, model, force_retranscribe)
+    finally:
+        # Clean up temporary files if created
+        cleanup_temporary_files(video_info)
+
+
+def _process_pipelined(processable_items, model, force_retranscribe, temp_dir, silence_params):
+    """
+    Yield (success, chunk_count, transcribed_count) per item, in order.
+    
+    Preparation (ffmpeg extraction and silence splitting, mostly I/O) runs on a
+    background thread up to PREPARE_PREFETCH items ahead, and finished items are
+    cleaned up on another, so both overlap with the transcription running here.
+    """
+    prepared = queue.Queue(maxsize=PREPARE_PREFETCH)
+    finished = queue.Queue()
+    end_of_items = object()  # prepared items can be None (failed), so not None
+    errors = []
+    
+    def prepare_all():
+        # Always end the stream, even if iterating the items raises (e.g. a
+        # PermissionError from discovery); the error is re-raised in the caller
+        try:
+            for item_info in processable_items:
+                prepared.put(_prepare_item(item_info, temp_dir, silence_params))
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            prepared.put(end_of_items)
+    
+    def cleanup_all():
+        while (video_info := finished.get()) is not None:
+            cleanup_temporary_files(video_info)
+    
+    # Daemon threads: an aborted batch must not hang on a preparer blocked on a full queue
+    threading.Thread(target=prepare_all, daemon=True).start()
+    cleaner = threading.Thread(target=cleanup_all, daemon=True)
+    cleaner.start()
+    try:
+        while (video_info := prepared.get()) is not end_of_items:
+            if video_info is None:
+                yield False, 0, 0
+                continue
+            try:
+                result = _transcribe_item(video_info, model, force_retranscribe)
+            finally:
+                finished.put(video_info)
+            yield result
+        if errors:
+            raise errors[0]
+    finally:
+        finished.put(None)
+        cleaner.join()
+
+
+def process_batch_items(processable_items, model, force_retranscribe, temp_dir, silence_params,
+                        max_workers=1):
     """
     Process a batch of items for transcription.
     
+    Items are independent (each has its own chunks directory). With one worker
+    they are transcribed in order while the next items are prepared and the
+    finished ones cleaned up in the background; with max_workers > 1 they run in
+    a process pool, one item per task. Every worker process loads its own
+    transcription model, so keep the pool small for Whisper.
+    
+    processable_items can be any iterable; items are pulled as they are needed
+    (the progress bar only shows a total when it has a length).
+    
     Returns:
         Tuple of (successful_count, failed_count, total_chunks, final_transcribed, duration)
     """
-    from .file_discovery import prepare_video_for_transcription
-    
     successful = 0
     failed = 0
     total_chunks = 0
+    final_transcribed = 0
     start_time = time.time()
-    processed_videos = []
     
-    for item_info in tqdm(processable_items, desc="Processing items", unit="item"):
-        try:
-            # Prepare item for transcription
-            video_info = prepare_video_for_transcription(item_info, temp_dir, silence_params)
-            if video_info is None:
-                failed += 1
-                continue
-            
-            processed_videos.append(video_info)
-            total_chunks += video_info['audio_count']
-            
-            # Transcribe using appropriate function based on model
-            if model == "both":
-                if transcribe_video_both_models(video_info, force_retranscribe):
-                    successful += 1
-                else:
-                    failed += 1
+    total = len(processable_items) if hasattr(processable_items, '__len__') else None
+    if total is not None:
+        max_workers = min(max_workers, total)
+    max_workers = max(1, max_workers)
+    if max_workers == 1:
+        results = _process_pipelined(processable_items, model, force_retranscribe, temp_dir, silence_params)
+        # Already-transcribed items finish in milliseconds; redraw the bar at most once a second
+        results = tqdm(results, total=total, desc="Processing items", unit="item", mininterval=1.0, smoothing=0.1)
+        pool = None
+    else:
+        # Workers share the progress file, so its read-modify-write updates are serialized
+        pool = ProcessPoolExecutor(max_workers=max_workers, initializer=set_progress_lock,
+                                   initargs=(multiprocessing.Lock(),))
+        futures = [pool.submit(_process_one, item_info, model, force_retranscribe, temp_dir, silence_params)
+                   for item_info in processable_items]
+        results = (future.result() for future in
+                   tqdm(as_completed(futures), total=len(futures), desc="Processing items", unit="item",
+                        mininterval=1.0, smoothing=0.1))
+    
+    try:
+        for success, chunk_count, transcribed in results:
+            if success:
+                successful += 1
             else:
-                if transcribe_video(video_info, model, force_retranscribe):
-                    successful += 1
-                else:
-                    failed += 1
-                
-        except Exception as e:
-            logger.error(f"❌ Error processing {item_info.get('video_id', 'unknown')}: {e}")
-            failed += 1
-        finally:
-            # Clean up temporary files if created
-            if 'video_info' in locals() and video_info is not None:
-                cleanup_temporary_files(video_info)
+                failed += 1
+            total_chunks += chunk_count
+            final_transcribed += transcribed
+    finally:
+        if pool is not None:
+            pool.shutdown()
     
     duration = time.time() - start_time
     
-    # Calculate final statistics
-    final_transcribed = 0
-    for video_info in processed_videos:
-        try:
-            if model == "both":
-                # For both models, count the total from both google and whisper
-                google_status = check_transcription_status(video_info['chunks_dir'], "google")
-                whisper_status = check_transcription_status(video_info['chunks_dir'], "whisper")
-                final_transcribed += google_status['text_count'] + whisper_status['text_count']
-            else:
-                status = check_transcription_status(video_info['chunks_dir'], model)
-                final_transcribed += status['text_count']
-        except:
-            pass
-    
     return successful, failed, total_chunks, final_transcribed, duration